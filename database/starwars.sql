@@ -565,464 +565,473 @@ INSERT INTO starships (id, MGLT, cargo_capacity, consumables, cost_in_credits, c
 
 -- JUNCTION TABLE DATA
 
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 1);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 2);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 3);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 4);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 5);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 6);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 7);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 8);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 9);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 10);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 12);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 13);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 14);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 15);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 16);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 18);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 19);
-INSERT INTO film_characters (film_id, character_id) VALUES (1, 81);
-INSERT INTO film_planets (film_id, planet_id) VALUES (1, 1);
-INSERT INTO film_planets (film_id, planet_id) VALUES (1, 2);
-INSERT INTO film_planets (film_id, planet_id) VALUES (1, 3);
-INSERT INTO film_starships (film_id, starship_id) VALUES (1, 2);
-INSERT INTO film_starships (film_id, starship_id) VALUES (1, 3);
-INSERT INTO film_starships (film_id, starship_id) VALUES (1, 5);
-INSERT INTO film_starships (film_id, starship_id) VALUES (1, 9);
-INSERT INTO film_starships (film_id, starship_id) VALUES (1, 10);
-INSERT INTO film_starships (film_id, starship_id) VALUES (1, 11);
-INSERT INTO film_starships (film_id, starship_id) VALUES (1, 12);
-INSERT INTO film_starships (film_id, starship_id) VALUES (1, 13);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (1, 4);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (1, 6);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (1, 7);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (1, 8);
-INSERT INTO film_species (film_id, species_id) VALUES (1, 1);
-INSERT INTO film_species (film_id, species_id) VALUES (1, 2);
-INSERT INTO film_species (film_id, species_id) VALUES (1, 3);
-INSERT INTO film_species (film_id, species_id) VALUES (1, 4);
-INSERT INTO film_species (film_id, species_id) VALUES (1, 5);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 1);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 2);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 3);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 4);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 5);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 10);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 13);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 14);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 18);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 20);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 21);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 22);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 23);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 24);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 25);
-INSERT INTO film_characters (film_id, character_id) VALUES (2, 26);
-INSERT INTO film_planets (film_id, planet_id) VALUES (2, 4);
-INSERT INTO film_planets (film_id, planet_id) VALUES (2, 5);
-INSERT INTO film_planets (film_id, planet_id) VALUES (2, 6);
-INSERT INTO film_planets (film_id, planet_id) VALUES (2, 27);
-INSERT INTO film_starships (film_id, starship_id) VALUES (2, 3);
-INSERT INTO film_starships (film_id, starship_id) VALUES (2, 10);
-INSERT INTO film_starships (film_id, starship_id) VALUES (2, 11);
-INSERT INTO film_starships (film_id, starship_id) VALUES (2, 12);
-INSERT INTO film_starships (film_id, starship_id) VALUES (2, 15);
-INSERT INTO film_starships (film_id, starship_id) VALUES (2, 17);
-INSERT INTO film_starships (film_id, starship_id) VALUES (2, 21);
-INSERT INTO film_starships (film_id, starship_id) VALUES (2, 22);
-INSERT INTO film_starships (film_id, starship_id) VALUES (2, 23);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (2, 8);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (2, 14);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (2, 16);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (2, 18);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (2, 19);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (2, 20);
-INSERT INTO film_species (film_id, species_id) VALUES (2, 1);
-INSERT INTO film_species (film_id, species_id) VALUES (2, 2);
-INSERT INTO film_species (film_id, species_id) VALUES (2, 3);
-INSERT INTO film_species (film_id, species_id) VALUES (2, 6);
-INSERT INTO film_species (film_id, species_id) VALUES (2, 7);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 1);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 2);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 3);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 4);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 5);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 10);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 13);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 14);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 16);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 18);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 20);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 21);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 22);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 25);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 27);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 28);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 29);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 30);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 31);
-INSERT INTO film_characters (film_id, character_id) VALUES (3, 45);
-INSERT INTO film_planets (film_id, planet_id) VALUES (3, 1);
-INSERT INTO film_planets (film_id, planet_id) VALUES (3, 5);
-INSERT INTO film_planets (film_id, planet_id) VALUES (3, 7);
-INSERT INTO film_planets (film_id, planet_id) VALUES (3, 8);
-INSERT INTO film_planets (film_id, planet_id) VALUES (3, 9);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 2);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 3);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 10);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 11);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 12);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 15);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 17);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 22);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 23);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 27);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 28);
-INSERT INTO film_starships (film_id, starship_id) VALUES (3, 29);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (3, 8);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (3, 16);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (3, 18);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (3, 19);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (3, 24);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (3, 25);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (3, 26);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (3, 30);
-INSERT INTO film_species (film_id, species_id) VALUES (3, 1);
-INSERT INTO film_species (film_id, species_id) VALUES (3, 2);
-INSERT INTO film_species (film_id, species_id) VALUES (3, 3);
-INSERT INTO film_species (film_id, species_id) VALUES (3, 5);
-INSERT INTO film_species (film_id, species_id) VALUES (3, 6);
-INSERT INTO film_species (film_id, species_id) VALUES (3, 8);
-INSERT INTO film_species (film_id, species_id) VALUES (3, 9);
-INSERT INTO film_species (film_id, species_id) VALUES (3, 10);
-INSERT INTO film_species (film_id, species_id) VALUES (3, 15);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 2);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 3);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 10);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 11);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 16);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 20);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 21);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 32);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 33);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 34);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 35);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 36);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 37);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 38);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 39);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 40);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 41);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 42);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 43);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 44);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 46);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 47);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 48);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 49);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 50);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 51);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 52);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 53);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 54);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 55);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 56);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 57);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 58);
-INSERT INTO film_characters (film_id, character_id) VALUES (4, 59);
-INSERT INTO film_planets (film_id, planet_id) VALUES (4, 1);
-INSERT INTO film_planets (film_id, planet_id) VALUES (4, 8);
-INSERT INTO film_planets (film_id, planet_id) VALUES (4, 9);
-INSERT INTO film_starships (film_id, starship_id) VALUES (4, 31);
-INSERT INTO film_starships (film_id, starship_id) VALUES (4, 32);
-INSERT INTO film_starships (film_id, starship_id) VALUES (4, 39);
-INSERT INTO film_starships (film_id, starship_id) VALUES (4, 40);
-INSERT INTO film_starships (film_id, starship_id) VALUES (4, 41);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (4, 33);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (4, 34);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (4, 35);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (4, 36);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (4, 37);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (4, 38);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (4, 42);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 1);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 2);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 6);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 11);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 12);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 13);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 14);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 15);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 16);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 17);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 18);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 19);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 20);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 21);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 22);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 23);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 24);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 25);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 26);
-INSERT INTO film_species (film_id, species_id) VALUES (4, 27);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 2);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 3);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 6);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 7);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 10);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 11);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 20);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 21);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 22);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 33);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 35);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 36);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 40);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 43);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 46);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 51);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 52);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 53);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 58);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 59);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 60);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 61);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 62);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 63);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 64);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 65);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 66);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 67);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 68);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 69);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 70);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 71);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 72);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 73);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 74);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 75);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 76);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 77);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 78);
-INSERT INTO film_characters (film_id, character_id) VALUES (5, 82);
-INSERT INTO film_planets (film_id, planet_id) VALUES (5, 1);
-INSERT INTO film_planets (film_id, planet_id) VALUES (5, 8);
-INSERT INTO film_planets (film_id, planet_id) VALUES (5, 9);
-INSERT INTO film_planets (film_id, planet_id) VALUES (5, 10);
-INSERT INTO film_planets (film_id, planet_id) VALUES (5, 11);
-INSERT INTO film_starships (film_id, starship_id) VALUES (5, 21);
-INSERT INTO film_starships (film_id, starship_id) VALUES (5, 32);
-INSERT INTO film_starships (film_id, starship_id) VALUES (5, 39);
-INSERT INTO film_starships (film_id, starship_id) VALUES (5, 43);
-INSERT INTO film_starships (film_id, starship_id) VALUES (5, 47);
-INSERT INTO film_starships (film_id, starship_id) VALUES (5, 48);
-INSERT INTO film_starships (film_id, starship_id) VALUES (5, 49);
-INSERT INTO film_starships (film_id, starship_id) VALUES (5, 52);
-INSERT INTO film_starships (film_id, starship_id) VALUES (5, 58);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 4);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 44);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 45);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 46);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 50);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 51);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 53);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 54);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 55);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 56);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (5, 57);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 1);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 2);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 6);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 12);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 13);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 15);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 28);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 29);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 30);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 31);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 32);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 33);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 34);
-INSERT INTO film_species (film_id, species_id) VALUES (5, 35);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 1);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 2);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 3);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 4);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 5);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 6);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 7);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 10);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 11);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 12);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 13);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 20);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 21);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 33);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 35);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 46);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 51);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 52);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 53);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 54);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 55);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 56);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 58);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 63);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 64);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 67);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 68);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 75);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 78);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 79);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 80);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 81);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 82);
-INSERT INTO film_characters (film_id, character_id) VALUES (6, 83);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 1);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 2);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 5);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 8);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 9);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 12);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 13);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 14);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 15);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 16);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 17);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 18);
-INSERT INTO film_planets (film_id, planet_id) VALUES (6, 19);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 2);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 32);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 48);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 59);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 61);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 63);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 64);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 65);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 66);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 68);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 74);
-INSERT INTO film_starships (film_id, starship_id) VALUES (6, 75);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 33);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 50);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 53);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 56);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 60);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 62);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 67);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 69);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 70);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 71);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 72);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 73);
-INSERT INTO film_vehicles (film_id, vehicle_id) VALUES (6, 76);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 1);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 2);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 3);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 6);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 15);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 19);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 20);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 23);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 24);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 25);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 26);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 27);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 28);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 29);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 30);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 33);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 34);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 35);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 36);
-INSERT INTO film_species (film_id, species_id) VALUES (6, 37);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (1, 14);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (1, 30);
-INSERT INTO character_starships (character_id, starship_id) VALUES (1, 12);
-INSERT INTO character_starships (character_id, starship_id) VALUES (1, 22);
-INSERT INTO character_starships (character_id, starship_id) VALUES (4, 13);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (5, 30);
-INSERT INTO character_starships (character_id, starship_id) VALUES (9, 12);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (10, 38);
-INSERT INTO character_starships (character_id, starship_id) VALUES (10, 48);
-INSERT INTO character_starships (character_id, starship_id) VALUES (10, 59);
-INSERT INTO character_starships (character_id, starship_id) VALUES (10, 64);
-INSERT INTO character_starships (character_id, starship_id) VALUES (10, 65);
-INSERT INTO character_starships (character_id, starship_id) VALUES (10, 74);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (11, 44);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (11, 46);
-INSERT INTO character_starships (character_id, starship_id) VALUES (11, 39);
-INSERT INTO character_starships (character_id, starship_id) VALUES (11, 59);
-INSERT INTO character_starships (character_id, starship_id) VALUES (11, 65);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (13, 19);
-INSERT INTO character_starships (character_id, starship_id) VALUES (13, 10);
-INSERT INTO character_starships (character_id, starship_id) VALUES (13, 22);
-INSERT INTO character_starships (character_id, starship_id) VALUES (14, 10);
-INSERT INTO character_starships (character_id, starship_id) VALUES (14, 22);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (18, 14);
-INSERT INTO character_starships (character_id, starship_id) VALUES (18, 12);
-INSERT INTO character_starships (character_id, starship_id) VALUES (19, 12);
-INSERT INTO character_starships (character_id, starship_id) VALUES (22, 21);
-INSERT INTO character_starships (character_id, starship_id) VALUES (25, 10);
-INSERT INTO character_starships (character_id, starship_id) VALUES (29, 28);
-INSERT INTO character_starships (character_id, starship_id) VALUES (31, 10);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (32, 38);
-INSERT INTO character_starships (character_id, starship_id) VALUES (35, 39);
-INSERT INTO character_starships (character_id, starship_id) VALUES (35, 49);
-INSERT INTO character_starships (character_id, starship_id) VALUES (35, 64);
-INSERT INTO character_starships (character_id, starship_id) VALUES (39, 40);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (44, 42);
-INSERT INTO character_starships (character_id, starship_id) VALUES (44, 41);
-INSERT INTO character_starships (character_id, starship_id) VALUES (58, 48);
-INSERT INTO character_starships (character_id, starship_id) VALUES (60, 39);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (67, 55);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (70, 45);
-INSERT INTO character_vehicles (character_id, vehicle_id) VALUES (79, 60);
-INSERT INTO character_starships (character_id, starship_id) VALUES (79, 74);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (14, 1);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (14, 18);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (19, 13);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (30, 1);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (30, 5);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (38, 10);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (38, 32);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (42, 44);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (44, 11);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (45, 70);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (46, 11);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (55, 67);
-INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES (60, 79);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (10, 13);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (10, 14);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (10, 25);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (10, 31);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (12, 1);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (12, 9);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (12, 18);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (12, 19);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (13, 4);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (21, 22);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (22, 1);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (22, 13);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (22, 14);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (28, 29);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (39, 11);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (39, 35);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (39, 60);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (40, 39);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (41, 44);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (48, 10);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (48, 58);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (49, 35);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (59, 10);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (59, 11);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (64, 10);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (64, 35);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (65, 10);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (65, 11);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (74, 10);
-INSERT INTO starship_pilots (starship_id, character_id) VALUES (74, 79);
+INSERT INTO film_characters (film_id, character_id) VALUES
+    (1, 1),
+    (1, 2),
+    (1, 3),
+    (1, 4),
+    (1, 5),
+    (1, 6),
+    (1, 7),
+    (1, 8),
+    (1, 9),
+    (1, 10),
+    (1, 12),
+    (1, 13),
+    (1, 14),
+    (1, 15),
+    (1, 16),
+    (1, 18),
+    (1, 19),
+    (1, 81),
+    (2, 1),
+    (2, 2),
+    (2, 3),
+    (2, 4),
+    (2, 5),
+    (2, 10),
+    (2, 13),
+    (2, 14),
+    (2, 18),
+    (2, 20),
+    (2, 21),
+    (2, 22),
+    (2, 23),
+    (2, 24),
+    (2, 25),
+    (2, 26),
+    (3, 1),
+    (3, 2),
+    (3, 3),
+    (3, 4),
+    (3, 5),
+    (3, 10),
+    (3, 13),
+    (3, 14),
+    (3, 16),
+    (3, 18),
+    (3, 20),
+    (3, 21),
+    (3, 22),
+    (3, 25),
+    (3, 27),
+    (3, 28),
+    (3, 29),
+    (3, 30),
+    (3, 31),
+    (3, 45),
+    (4, 2),
+    (4, 3),
+    (4, 10),
+    (4, 11),
+    (4, 16),
+    (4, 20),
+    (4, 21),
+    (4, 32),
+    (4, 33),
+    (4, 34),
+    (4, 35),
+    (4, 36),
+    (4, 37),
+    (4, 38),
+    (4, 39),
+    (4, 40),
+    (4, 41),
+    (4, 42),
+    (4, 43),
+    (4, 44),
+    (4, 46),
+    (4, 47),
+    (4, 48),
+    (4, 49),
+    (4, 50),
+    (4, 51),
+    (4, 52),
+    (4, 53),
+    (4, 54),
+    (4, 55),
+    (4, 56),
+    (4, 57),
+    (4, 58),
+    (4, 59),
+    (5, 2),
+    (5, 3),
+    (5, 6),
+    (5, 7),
+    (5, 10),
+    (5, 11),
+    (5, 20),
+    (5, 21),
+    (5, 22),
+    (5, 33),
+    (5, 35),
+    (5, 36),
+    (5, 40),
+    (5, 43),
+    (5, 46),
+    (5, 51),
+    (5, 52),
+    (5, 53),
+    (5, 58),
+    (5, 59),
+    (5, 60),
+    (5, 61),
+    (5, 62),
+    (5, 63),
+    (5, 64),
+    (5, 65),
+    (5, 66),
+    (5, 67),
+    (5, 68),
+    (5, 69),
+    (5, 70),
+    (5, 71),
+    (5, 72),
+    (5, 73),
+    (5, 74),
+    (5, 75),
+    (5, 76),
+    (5, 77),
+    (5, 78),
+    (5, 82),
+    (6, 1),
+    (6, 2),
+    (6, 3),
+    (6, 4),
+    (6, 5),
+    (6, 6),
+    (6, 7),
+    (6, 10),
+    (6, 11),
+    (6, 12),
+    (6, 13),
+    (6, 20),
+    (6, 21),
+    (6, 33),
+    (6, 35),
+    (6, 46),
+    (6, 51),
+    (6, 52),
+    (6, 53),
+    (6, 54),
+    (6, 55),
+    (6, 56),
+    (6, 58),
+    (6, 63),
+    (6, 64),
+    (6, 67),
+    (6, 68),
+    (6, 75),
+    (6, 78),
+    (6, 79),
+    (6, 80),
+    (6, 81),
+    (6, 82),
+    (6, 83);
+INSERT INTO film_planets (film_id, planet_id) VALUES
+    (1, 1),
+    (1, 2),
+    (1, 3),
+    (2, 4),
+    (2, 5),
+    (2, 6),
+    (2, 27),
+    (3, 1),
+    (3, 5),
+    (3, 7),
+    (3, 8),
+    (3, 9),
+    (4, 1),
+    (4, 8),
+    (4, 9),
+    (5, 1),
+    (5, 8),
+    (5, 9),
+    (5, 10),
+    (5, 11),
+    (6, 1),
+    (6, 2),
+    (6, 5),
+    (6, 8),
+    (6, 9),
+    (6, 12),
+    (6, 13),
+    (6, 14),
+    (6, 15),
+    (6, 16),
+    (6, 17),
+    (6, 18),
+    (6, 19);
+INSERT INTO film_starships (film_id, starship_id) VALUES
+    (1, 2),
+    (1, 3),
+    (1, 5),
+    (1, 9),
+    (1, 10),
+    (1, 11),
+    (1, 12),
+    (1, 13),
+    (2, 3),
+    (2, 10),
+    (2, 11),
+    (2, 12),
+    (2, 15),
+    (2, 17),
+    (2, 21),
+    (2, 22),
+    (2, 23),
+    (3, 2),
+    (3, 3),
+    (3, 10),
+    (3, 11),
+    (3, 12),
+    (3, 15),
+    (3, 17),
+    (3, 22),
+    (3, 23),
+    (3, 27),
+    (3, 28),
+    (3, 29),
+    (4, 31),
+    (4, 32),
+    (4, 39),
+    (4, 40),
+    (4, 41),
+    (5, 21),
+    (5, 32),
+    (5, 39),
+    (5, 43),
+    (5, 47),
+    (5, 48),
+    (5, 49),
+    (5, 52),
+    (5, 58),
+    (6, 2),
+    (6, 32),
+    (6, 48),
+    (6, 59),
+    (6, 61),
+    (6, 63),
+    (6, 64),
+    (6, 65),
+    (6, 66),
+    (6, 68),
+    (6, 74),
+    (6, 75);
+INSERT INTO film_vehicles (film_id, vehicle_id) VALUES
+    (1, 4),
+    (1, 6),
+    (1, 7),
+    (1, 8),
+    (2, 8),
+    (2, 14),
+    (2, 16),
+    (2, 18),
+    (2, 19),
+    (2, 20),
+    (3, 8),
+    (3, 16),
+    (3, 18),
+    (3, 19),
+    (3, 24),
+    (3, 25),
+    (3, 26),
+    (3, 30),
+    (4, 33),
+    (4, 34),
+    (4, 35),
+    (4, 36),
+    (4, 37),
+    (4, 38),
+    (4, 42),
+    (5, 4),
+    (5, 44),
+    (5, 45),
+    (5, 46),
+    (5, 50),
+    (5, 51),
+    (5, 53),
+    (5, 54),
+    (5, 55),
+    (5, 56),
+    (5, 57),
+    (6, 33),
+    (6, 50),
+    (6, 53),
+    (6, 56),
+    (6, 60),
+    (6, 62),
+    (6, 67),
+    (6, 69),
+    (6, 70),
+    (6, 71),
+    (6, 72),
+    (6, 73),
+    (6, 76);
+INSERT INTO film_species (film_id, species_id) VALUES
+    (1, 1),
+    (1, 2),
+    (1, 3),
+    (1, 4),
+    (1, 5),
+    (2, 1),
+    (2, 2),
+    (2, 3),
+    (2, 6),
+    (2, 7),
+    (3, 1),
+    (3, 2),
+    (3, 3),
+    (3, 5),
+    (3, 6),
+    (3, 8),
+    (3, 9),
+    (3, 10),
+    (3, 15),
+    (4, 1),
+    (4, 2),
+    (4, 6),
+    (4, 11),
+    (4, 12),
+    (4, 13),
+    (4, 14),
+    (4, 15),
+    (4, 16),
+    (4, 17),
+    (4, 18),
+    (4, 19),
+    (4, 20),
+    (4, 21),
+    (4, 22),
+    (4, 23),
+    (4, 24),
+    (4, 25),
+    (4, 26),
+    (4, 27),
+    (5, 1),
+    (5, 2),
+    (5, 6),
+    (5, 12),
+    (5, 13),
+    (5, 15),
+    (5, 28),
+    (5, 29),
+    (5, 30),
+    (5, 31),
+    (5, 32),
+    (5, 33),
+    (5, 34),
+    (5, 35),
+    (6, 1),
+    (6, 2),
+    (6, 3),
+    (6, 6),
+    (6, 15),
+    (6, 19),
+    (6, 20),
+    (6, 23),
+    (6, 24),
+    (6, 25),
+    (6, 26),
+    (6, 27),
+    (6, 28),
+    (6, 29),
+    (6, 30),
+    (6, 33),
+    (6, 34),
+    (6, 35),
+    (6, 36),
+    (6, 37);
+INSERT INTO character_vehicles (character_id, vehicle_id) VALUES
+    (1, 14),
+    (1, 30),
+    (5, 30),
+    (10, 38),
+    (11, 44),
+    (11, 46),
+    (13, 19),
+    (18, 14),
+    (32, 38),
+    (44, 42),
+    (67, 55),
+    (70, 45),
+    (79, 60);
+INSERT INTO character_starships (character_id, starship_id) VALUES
+    (1, 12),
+    (1, 22),
+    (4, 13),
+    (9, 12),
+    (10, 48),
+    (10, 59),
+    (10, 64),
+    (10, 65),
+    (10, 74),
+    (11, 39),
+    (11, 59),
+    (11, 65),
+    (13, 10),
+    (13, 22),
+    (14, 10),
+    (14, 22),
+    (18, 12),
+    (19, 12),
+    (22, 21),
+    (25, 10),
+    (29, 28),
+    (31, 10),
+    (35, 39),
+    (35, 49),
+    (35, 64),
+    (39, 40),
+    (44, 41),
+    (58, 48),
+    (60, 39),
+    (79, 74);
+INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES
+    (14, 1),
+    (14, 18),
+    (19, 13),
+    (30, 1),
+    (30, 5),
+    (38, 10),
+    (38, 32),
+    (42, 44),
+    (44, 11),
+    (45, 70),
+    (46, 11),
+    (55, 67),
+    (60, 79);
+INSERT INTO starship_pilots (starship_id, character_id) VALUES
+    (10, 13),
+    (10, 14),
+    (10, 25),
+    (10, 31),
+    (12, 1),
+    (12, 9),
+    (12, 18),
+    (12, 19),
+    (13, 4),
+    (21, 22),
+    (22, 1),
+    (22, 13),
+    (22, 14),
+    (28, 29),
+    (39, 11),
+    (39, 35),
+    (39, 60),
+    (40, 39),
+    (41, 44),
+    (48, 10),
+    (48, 58),
+    (49, 35),
+    (59, 10),
+    (59, 11),
+    (64, 10),
+    (64, 35),
+    (65, 10),
+    (65, 11),
+    (74, 10),
+    (74, 79);
 
 -- USEFUL VIEWS AND QUERIES
 
@@ -2,6 +2,8 @@
 """
 Demo script showing basic DuckDB usage
 """
+import traceback
+
 import duckdb
 
 
@@ -27,6 +29,8 @@ def main():
                 statements = [stmt.strip() for stmt in setup_sql.split(';') if stmt.strip()]
                 for stmt in statements:
                     con.execute(stmt)
+                # Re-list only after setup created the tables
+                tables = con.execute("SHOW TABLES").fetchall()
             except FileNotFoundError:
                 print("❌ setup.sql file not found")
                 return
@@ -35,7 +39,6 @@ def main():
         
         # 2. List available tables
         print("\n2. Available tables:")
-        tables = con.execute("SHOW TABLES").fetchall()
         for table in tables:
             print(f"  - {table[0]}")
         
@@ -50,10 +53,10 @@ def main():
             JOIN nation n ON c.c_nationkey = n.n_nationkey
             GROUP BY n.n_name
             ORDER BY customer_count DESC
-        """).fetchall()
+        """).fetch_arrow_table()
         
-        for row in result:
-            print(f"  {row[0]}: {row[1]} customers")
+        for row in result.to_pylist():
+            print(f"  {row['n_name']}: {row['customer_count']} customers")
         
         # Query 2: Top customers by account balance
         print("\n💰 Top customers by account balance:")
@@ -63,15 +66,16 @@ def main():
             JOIN nation n ON c.c_nationkey = n.n_nationkey
             ORDER BY c_acctbal DESC
             LIMIT 5
-        """).fetchall()
+        """).fetch_arrow_table()
         
-        for row in result:
-            print(f"  {row[0]}: ${row[1]:.2f} ({row[2]})")
+        for row in result.to_pylist():
+            print(f"  {row['c_name']}: ${row['c_acctbal']:.2f} ({row['n_name']})")
         
         print("\n✅ Demo completed!")
         
     except Exception as e:
         print(f"❌ Error: {e}")
+        traceback.print_exc()
     finally:
         if con is not None:
             con.close()
@@ -175,17 +175,17 @@ WITH date_ranges AS (
 SELECT 
     start_date,
     end_date,
-    py_business_days_between(start_date, end_date) as business_days
+    py_business_days_between(start_date::DATE, end_date::DATE) as business_days
 FROM date_ranges;
 
 -- Quarter analysis with TPC-H orders
 SELECT 
-    py_get_quarter_name(o_orderdate::VARCHAR) as quarter,
+    py_get_quarter_name(o_orderdate) as quarter,
     COUNT(*) as order_count,
     AVG(o_totalprice) as avg_order_value
 FROM orders 
 WHERE o_orderdate BETWEEN '1995-01-01' AND '1996-12-31'
-GROUP BY py_get_quarter_name(o_orderdate::VARCHAR)
+GROUP BY py_get_quarter_name(o_orderdate)
 ORDER BY quarter;
 
 -- Days until weekend analysis
@@ -201,7 +201,7 @@ WITH sample_dates AS (
 SELECT 
     date_val,
     EXTRACT(DOW FROM date_val::DATE) as day_of_week,
-    py_days_until_weekend(date_val) as days_to_weekend
+    py_days_until_weekend(date_val::DATE) as days_to_weekend
 FROM sample_dates;
 
 -- =============================================
@@ -420,6 +420,22 @@ SELECT
     ) * 111.0 as sql_approximation_km,
     'Python UDF provides accurate Haversine formula, SQL approximation is faster but less accurate' as accuracy_note;
 
+-- JSON field extraction comparison
+WITH sample_json AS (
+    SELECT json_data FROM VALUES 
+        ('{"name": "John", "age": 30}'),
+        ('{"product": "Widget", "price": 19.99}')
+    AS t(json_data)
+)
+SELECT 
+    'JSON Extraction Comparison' as calculation_type,
+    -- Python UDF (parses the whole document in Python)
+    py_parse_json_field(json_data, 'name') as python_udf_result,
+    -- Native DuckDB JSON extension (no Python round-trip, NULL when missing)
+    json_extract_string(json_data, '$.name') as sql_result,
+    'Prefer native json_extract_string for valid JSON; the UDF also tolerates invalid input' as performance_note
+FROM sample_json;
+
 -- =============================================
 -- 9. REAL-WORLD BUSINESS SCENARIOS
 -- =============================================
@@ -457,7 +473,7 @@ SELECT
     is_express,
     py_calculate_shipping_cost(estimated_weight, estimated_distance, is_express, customer_tier) as shipping_cost,
     py_assess_credit_risk(c_acctbal, 75, 5) as credit_risk,
-    py_get_quarter_name(o_orderdate::VARCHAR) as order_quarter,
+    py_get_quarter_name(o_orderdate) as order_quarter,
     -- Total cost including shipping
     o_totalprice + py_calculate_shipping_cost(estimated_weight, estimated_distance, is_express, customer_tier) as total_with_shipping
 FROM enhanced_orders
@@ -491,7 +507,7 @@ SELECT
     -- Business days between first and last order
     CASE 
         WHEN first_order_date IS NOT NULL AND last_order_date IS NOT NULL 
-        THEN py_business_days_between(first_order_date::VARCHAR, last_order_date::VARCHAR)
+        THEN py_business_days_between(first_order_date, last_order_date)
         ELSE 0
     END as customer_lifespan_days,
     -- Customer tier based on spending
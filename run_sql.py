@@ -4,64 +4,173 @@ Simple SQL file runner - Quick execution of SQL files
 """
 import sys
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 import duckdb
 
+# Single-pass scanner: quoted strings (with doubled or backslash-escaped quotes), /* */ blocks
+# (kept, so apostrophes inside them are not read as quotes) or a -- comment
+_SQL_COMMENT_RE = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"|/\*[\s\S]*?\*/|--[^\n]*")
+
+# MERGE statements aren't supported through the Python client; found without uppercasing the file
+_MERGE_RE = re.compile(r'\bMERGE\b', re.IGNORECASE)
+
+# First keyword of a statement, found without copying or uppercasing the statement itself
+_KEYWORD_RE = re.compile(r'\s*([A-Za-z]+)')
+
+# Statements whose results are fetched and previewed
+_QUERY_KEYWORDS = frozenset({'SELECT', 'DESCRIBE', 'SHOW'})
+
+# INSERT INTO <table> [(<columns>)] VALUES (...)[, (...)]; runs of these on one table are batched
+_INSERT_VALUES_RE = re.compile(r'INSERT\s+INTO\s+([\w."]+(?:\s*\([^()]*\))?)\s*VALUES\s*(\(.*\))\s*$',
+                               re.IGNORECASE | re.DOTALL)
+_INSERT_TRAILER_RE = re.compile(r'\b(?:ON\s+CONFLICT|RETURNING)\b', re.IGNORECASE)
+
+# Non-query statements are submitted in batches of up to this many, each in one transaction
+_BATCH_SIZE = 64
+# Statements that must run on their own rather than inside a batch transaction
+_UNBATCHED_KEYWORDS = frozenset({'BEGIN', 'START', 'COMMIT', 'END', 'ROLLBACK', 'ABORT', 'ATTACH', 'DETACH',
+                                 'USE', 'CHECKPOINT', 'VACUUM', 'EXPORT', 'IMPORT', 'INSTALL', 'LOAD'})
+# Statements that open and close a transaction of the script's own; batching is off while one is open
+_TRANSACTION_START_KEYWORDS = frozenset({'BEGIN', 'START'})
+_TRANSACTION_END_KEYWORDS = frozenset({'COMMIT', 'END', 'ROLLBACK', 'ABORT'})
+
+
+@lru_cache(maxsize=None)
+def _resolve_directory(directory):
+    """Resolve a directory path once (realpath walks every component)"""
+    return Path(directory).resolve()
+
+
+def _resolved_cwd():
+    """Resolved current working directory, re-resolved only if the process changes directory"""
+    return _resolve_directory(os.getcwd())
+
+
+def _keep_quoted(match):
+    """Regex replacement that keeps quoted strings and block comments, dropping -- comments"""
+    text = match.group(0)
+    return '' if text.startswith('--') else text
+
 
 def remove_sql_comments(sql_content):
     """Remove SQL comments while preserving quoted strings"""
-    lines = sql_content.split('\n')
-    clean_lines = []
-    
-    for line in lines:
-        stripped = line.strip()
-        if stripped.startswith('--'):
-            continue
-        elif '--' in line:
-            # Remove comments if not inside quotes
-            in_quotes = False
-            quote_char = None
-            i = 0
-            while i < len(line):
-                char = line[i]
-                if char in ("'", '"') and not in_quotes:
-                    in_quotes = True
-                    quote_char = char
-                elif char == quote_char and in_quotes:
-                    # Check for escaped quotes (doubled quotes or backslash-escaped)
-                    if i > 0 and line[i - 1] == '\\':
-                        pass  # Skip backslash-escaped quote
-                    elif i + 1 < len(line) and line[i + 1] == quote_char:
-                        i += 1  # Skip doubled quote
-                    else:
-                        in_quotes = False
-                        quote_char = None
-                elif not in_quotes and line[i:i+2] == '--':
-                    line = line[:i]
-                    break
-                i += 1
-        if line.strip():
-            clean_lines.append(line)
-    
-    return '\n'.join(clean_lines)
+    if '--' not in sql_content:
+        return sql_content
+    # Quoted strings match as a whole, so only comments outside quotes are dropped
+    return _SQL_COMMENT_RE.sub(_keep_quoted, sql_content)
+
+
+def leading_keyword(statement):
+    """Return the uppercased first keyword of a statement, or '' if it doesn't start with one"""
+    match = _KEYWORD_RE.match(statement)
+    return match.group(1).upper() if match else ''
+
+
+def group_inserts(statements):
+    """Group adjacent INSERT ... VALUES statements on the same target into (target, statements, values)"""
+    groups = []
+    for statement in statements:
+        match = _INSERT_VALUES_RE.match(statement)
+        if match and not _INSERT_TRAILER_RE.search(match.group(2)):
+            target, values = match.group(1), match.group(2)
+            key = ' '.join(target.lower().split())
+            if groups and groups[-1][0] == key:
+                groups[-1][2].append(statement)
+                groups[-1][3].append(values)
+                continue
+            groups.append((key, target, [statement], [values]))
+        else:
+            groups.append((None, None, [statement], None))
+    return [(target, group, values) for _, target, group, values in groups]
+
+
+def execute_statement(con, i, statement, out):
+    """Execute a single SQL statement, appending its report lines to out"""
+    try:
+        cursor = con.execute(statement)
+        if leading_keyword(statement) in _QUERY_KEYWORDS:
+            # Fetch one row past the preview to know whether more exist, without materializing the rest
+            rows = cursor.fetchmany(6)
+            has_more = len(rows) > 5
+            rows = rows[:5]
+            out.append(f"  ✅ Statement {i}: first {len(rows)} rows shown" + ("; more available" if has_more else ""))
+            out.extend(f"    {row}" for row in rows)
+        else:
+            out.append(f"  ✅ Statement {i}: Executed successfully")
+    except Exception as stmt_e:
+        out.append(f"  ❌ SQL Error in statement {i}: {stmt_e}")
+
+
+def execute_in_transaction(con, sql):
+    """Execute (possibly multi-statement) SQL atomically; returns False, with nothing applied, on error"""
+    # Only called while the script has no transaction of its own open (execute_statements tracks that)
+    con.execute("BEGIN TRANSACTION")
+    try:
+        con.execute(sql)
+        con.execute("COMMIT")
+        return True
+    except Exception:
+        con.execute("ROLLBACK")
+        return False
+
+
+def execute_batch(con, batch, out):
+    """Execute a batch of (index, target, statements, values) units in one call, else unit by unit"""
+    if not batch:
+        return
+    units = [f"INSERT INTO {target} VALUES {', '.join(values)}" if len(group) > 1 else group[0]
+             for _, target, group, values in batch]
+    first = batch[0][0]
+    count = sum(len(group) for _, _, group, _ in batch)
+    if count > 1 and execute_in_transaction(con, ';\n'.join(units)):
+        out.append(f"  ✅ Statements {first}-{first + count - 1}: Executed successfully as one batch")
+        return
+    # Re-run unit by unit so each failing statement is reported
+    for (i, _, group, _), unit in zip(batch, units):
+        if len(group) > 1:
+            try:
+                con.execute(unit)
+                out.append(f"  ✅ Statements {i}-{i + len(group) - 1}: {len(group)} INSERTs executed as one batch")
+                continue
+            except Exception:
+                pass
+        for offset, statement in enumerate(group):
+            execute_statement(con, i + offset, statement, out)
 
 
 def execute_statements(con, statements):
-    """Execute SQL statements one by one with result handling"""
-    for i, statement in enumerate(statements, 1):
-        try:
-            cursor = con.execute(statement)
-            if statement.strip().upper().startswith(('SELECT', 'DESCRIBE', 'SHOW')):
-                result = cursor.fetchall()
-                print(f"  ✅ Statement {i}: {len(result)} rows")
-                for row in result[:5]:
-                    print(f"    {row}")
-                if len(result) > 5:
-                    print(f"    ... and {len(result) - 5} more rows")
-            else:
-                print(f"  ✅ Statement {i}: Executed successfully")
-        except Exception as stmt_e:
-            print(f"  ❌ SQL Error in statement {i}: {stmt_e}")
+    """Execute SQL statements with result handling, batching consecutive non-query statements"""
+    # Report lines are collected and written once at the end instead of a print per line
+    out = []
+    batch = []
+    in_transaction = False  # Whether the script has opened a transaction of its own
+    i = 1
+    for target, group, values in group_inserts(statements):
+        keyword = leading_keyword(group[0])
+        if in_transaction or (len(group) == 1 and (keyword in _QUERY_KEYWORDS or keyword in _UNBATCHED_KEYWORDS)):
+            # Queries print their rows, transaction/database control can't run inside a batch, and
+            # inside the script's own transaction statements run one by one exactly as written
+            execute_batch(con, batch, out)
+            batch = []
+            for offset, statement in enumerate(group):
+                execute_statement(con, i + offset, statement, out)
+            if keyword in _TRANSACTION_START_KEYWORDS:
+                in_transaction = True
+            elif keyword in _TRANSACTION_END_KEYWORDS:
+                in_transaction = False
+        else:
+            batch.append((i, target, group, values))
+            if len(batch) == _BATCH_SIZE:
+                execute_batch(con, batch, out)
+                batch = []
+        i += len(group)
+    execute_batch(con, batch, out)
+    if out:
+        sys.stdout.write('\n'.join(out) + '\n')
+        sys.stdout.flush()
 
 
 def execute_sql_file(con, sql_content):
@@ -82,20 +191,14 @@ def execute_sql_file(con, sql_content):
         execute_statements(con, statements)
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python run_sql.py <sql_file>")
-        print("Example: python run_sql.py exercises/section-3-ddl/create.sql")
-        sys.exit(1)
-    
-    sql_file = sys.argv[1]
-    
+def resolve_sql_path(sql_file):
+    """Validate a SQL file path and resolve it, exiting on invalid or missing files"""
     # Validate path to prevent path traversal attacks
     try:
         sql_path = Path(sql_file)
         # Resolve and validate resolved path is within current directory
         resolved_path = sql_path.resolve()
-        resolved_cwd = Path.cwd().resolve()
+        resolved_cwd = _resolved_cwd()
         resolved_path.relative_to(resolved_cwd)
         sql_path = resolved_path
     except (ValueError, OSError):
@@ -106,28 +209,49 @@ def main():
         print(f"❌ File not found: {sql_file}")
         sys.exit(1)
     
+    return sql_path
+
+
+def read_sql_files(sql_paths):
+    """Yield each file's SQL text; with several files, reads run ahead in threads while DuckDB executes"""
+    if len(sql_paths) == 1:
+        yield sql_paths[0].read_text(encoding='utf-8')
+        return
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(path.read_text, encoding='utf-8') for path in sql_paths]
+        for future in futures:
+            yield future.result()
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python run_sql.py <sql_file> [<sql_file> ...]")
+        print("Example: python run_sql.py exercises/section-3-ddl/create.sql")
+        sys.exit(1)
+    
+    sql_files = sys.argv[1:]
+    sql_paths = [resolve_sql_path(sql_file) for sql_file in sql_files]
+    
     con = None
     
     try:
-        # Connect to database
+        # Connect to database once and share it across all files
         con = duckdb.connect("sample.db")  # Use persistent database with sample data
+        con.execute("PRAGMA enable_object_cache")
         
-        print(f"📄 Executing: {sql_path}")
-        
-        # Read and execute SQL file
-        with open(sql_path, 'r', encoding='utf-8') as f:
-            sql_content = f.read()
-        
-        # Check for MERGE statements
-        if 'MERGE' in sql_content.upper():
-            print("  ⚠️  MERGE statements detected. Python DuckDB doesn't support MERGE syntax.")
-            print("  💡 Alternative: Use DuckDB CLI instead:")
-            print(f"     duckdb sample.db < {sql_file}")
-            return
-        
-        execute_sql_file(con, sql_content)
-        
-        print("✅ File execution completed!")
+        for sql_file, sql_path, sql_content in zip(sql_files, sql_paths, read_sql_files(sql_paths)):
+            print(f"📄 Executing: {sql_path}")
+            
+            # Check for MERGE statements
+            if _MERGE_RE.search(sql_content):
+                print("  ⚠️  MERGE statements detected. Python DuckDB doesn't support MERGE syntax.")
+                print("  💡 Alternative: Use DuckDB CLI instead:")
+                print(f"     duckdb sample.db < {sql_file}")
+                continue
+            
+            execute_sql_file(con, sql_content)
+            
+            print("✅ File execution completed!")
         
     except FileNotFoundError as e:
         print(f"❌ File not found: {e}")
@@ -3,11 +3,144 @@
 SQL Runner - Execute SQL files against DuckDB
 """
 import duckdb
+import mmap
 import os
+import re
 import sys
 import argparse
+import atexit
+import heapq
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# pyarrow is optional: when present, query results are rendered column-wise from Arrow
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# Leading keyword of a statement (SELECT, INSERT, CREATE, ...)
+_KEYWORD_RE = re.compile(r'[A-Za-z]+')
+
+# Comment stripping for the statement splitter: quoted text is matched first so that -- and /* inside
+# a literal survive, then -- comments (to the end of the line) and /* */ blocks are dropped
+_COMMENT_RE = re.compile(r"('[^']*'?|\"[^\"]*\"?)|--[^\n]*|/\*.*?(?:\*/|\Z)", re.DOTALL)
+_BLANK_LINES_RE = re.compile(r'^\s*\n', re.MULTILINE)
+_LEADING_COMMENTS_RE = re.compile(r'(?:\s+|--[^\n]*|/\*.*?\*/)*', re.DOTALL)
+
+# One statement: a run of anything but ';', where quoted text (doubled quotes are two adjacent
+# literals, an unterminated one runs to the end) may contain ';'
+_STATEMENT_RE = re.compile(r"(?:[^;'\"]+|'[^']*'?|\"[^\"]*\"?)+")
+
+# Keywords rejected in query mode, matched in one case-insensitive pass over the query
+_DANGEROUS_KEYWORDS_RE = re.compile(r'\b(?:UNION|INTO|OUTFILE|DUMPFILE|LOAD_FILE)\b', re.IGNORECASE)
+
+# INSERT INTO <table> [(<columns>)] VALUES (...)[, (...)]; adjacent ones on one table are merged
+_INSERT_VALUES_RE = re.compile(r'INSERT\s+INTO\s+([\w."]+(?:\s*\([^()]*\))?)\s*VALUES\s*(\(.*\))\s*$',
+                               re.IGNORECASE | re.DOTALL)
+_INSERT_TRAILER_RE = re.compile(r'\b(?:ON\s+CONFLICT|RETURNING)\b', re.IGNORECASE)
+
+# Tables of the main schema, as listed by the tables command and dropped by clean; duckdb_tables()
+# reads the catalog directly instead of going through the information_schema view
+_LIST_TABLES_SQL = (
+    "SELECT table_name FROM duckdb_tables() "
+    "WHERE schema_name = 'main' ORDER BY table_name"
+)
+
+# Statements that control transactions or databases, so they can't run inside a grouped transaction
+_NON_TRANSACTIONAL_KEYWORDS = frozenset({
+    'BEGIN', 'START', 'COMMIT', 'END', 'ROLLBACK', 'ABORT', 'ATTACH', 'DETACH',
+    'USE', 'CHECKPOINT', 'VACUUM', 'EXPORT', 'IMPORT', 'INSTALL', 'LOAD',
+})
+
+
+@lru_cache(maxsize=None)
+def _resolve_directory(directory: str) -> Path:
+    """Resolve a directory path once (realpath walks every component)"""
+    return Path(directory).resolve()
+
+
+def _resolved_cwd() -> Path:
+    """Resolved current working directory, re-resolved only if the process changes directory"""
+    return _resolve_directory(os.getcwd())
+
+
+def _resolve_path(path: str, cwd: str) -> str:
+    """Canonical form of a path given relative to cwd"""
+    # Resolved on every call: a cached answer would miss a symlink swapped in since the last check
+    return os.path.realpath(os.path.join(cwd, path))
+
+
+def _is_within(path: str, directory: str) -> bool:
+    """Whether a canonical path is directory itself or lies below it"""
+    return path == directory or path.startswith(os.path.join(directory, ''))
+
+
+# Directories never searched for SQL files (version control, dependencies, caches)
+_PRUNED_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv'})
+
+# How many SQL files the interactive files command lists
+_FILES_SHOWN = 200
+
+
+def _walk_sql_files(dirpath: str) -> Iterator[str]:
+    """Yield the paths of .sql files under dirpath, without following symlinks"""
+    try:
+        with os.scandir(dirpath) as entries:
+            for entry in entries:
+                # DirEntry answers is_dir/is_file from the directory listing itself, so no extra stat
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _PRUNED_DIRS:
+                        yield from _walk_sql_files(entry.path)
+                elif entry.name.endswith('.sql') and entry.is_file(follow_symlinks=False):
+                    yield entry.path
+    except OSError:
+        pass  # Unreadable directories are skipped
+
+
+# Interactive mode: a command name and its optional argument, and the help text shown for it
+_COMMAND_RE = re.compile(r'(\S+)(?:\s+(.*))?', re.DOTALL)
+_HELP_TEXT = """Commands:
+  setup    - Run tpc-h.sql
+  starwars - Create Star Wars database
+  clean    - Drop all tables
+  tables   - List all tables
+  files    - List available SQL files
+  run <file> - Execute SQL file
+  query <sql> - Execute SQL query
+  help     - Show this help message
+  quit/exit - Exit
+"""
+
+# Threads reading SQL files ahead when several files are run
+_READ_AHEAD_WORKERS = 4
+
+# Number of parsed SQL files each runner keeps for re-execution
+_PARSE_CACHE_SIZE = 64
+
+# One DuckDB connection per database file for the whole process, so creating another runner
+# doesn't pay for reopening the database (WAL replay, catalog load) again; runners use cursors on it
+_CONNECTIONS: Dict[str, duckdb.DuckDBPyConnection] = {}
+
+
+def _get_connection(db_path: str) -> duckdb.DuckDBPyConnection:
+    """Return the process-wide connection for a database file, opening it on first use"""
+    conn = _CONNECTIONS.get(db_path)
+    if conn is None:
+        conn = _CONNECTIONS[db_path] = duckdb.connect(db_path)
+    return conn
+
+
+@atexit.register
+def _close_connections() -> None:
+    """Close the shared database connections when the process exits"""
+    while _CONNECTIONS:
+        _, conn = _CONNECTIONS.popitem()
+        conn.close()
 
 
 class SQLRunner:
@@ -20,7 +153,7 @@ class SQLRunner:
         # Validate database path to prevent path traversal
         try:
             db_path_obj = Path(db_path).resolve()
-            current_dir = Path.cwd().resolve()
+            current_dir = _resolved_cwd()
             data_dir_resolved = (current_dir / "data").resolve()
             
             # Allow database files in current directory, data/ subdirectory, or data/databases/
@@ -35,145 +168,307 @@ class SQLRunner:
             raise
             
         try:
-            self.conn = duckdb.connect(self.db_path)
+            # A cursor has its own transaction and USE state but shares the open database
+            self.conn = _get_connection(self.db_path).cursor()
         except Exception as e:
             print(f"❌ Failed to connect to database: {e}")
             raise
         
-    def _split_sql_statements(self, sql_content: str) -> List[str]:
-        """Split SQL content into individual statements, handling basic cases"""
+        # Parsed statements of recently executed files, keyed by (path, size, mtime), least recent first
+        self._parse_cache: "OrderedDict[Tuple[str, int, int], List[Tuple[str, str]]]" = OrderedDict()
+        
+    def _split_sql_statements(self, sql_content: str) -> List[Tuple[str, str]]:
+        """Split SQL content into (statement, leading keyword) pairs, handling basic cases"""
         try:
             if not isinstance(sql_content, str):
                 raise TypeError("SQL content must be a string")
             
-            # Remove comment-only lines first
-            lines = sql_content.split('\n')
-            clean_lines = []
-            for line in lines:
-                stripped = line.strip()
-                if stripped.startswith('--'):
-                    continue  # Skip comment-only lines
-                elif '--' in line:
-                    # Keep part before inline comment
-                    line = line[:line.index('--')]
-                if line.strip():
-                    clean_lines.append(line)
-            
-            clean_sql = '\n'.join(clean_lines)
-            
-            # Split by semicolon using more efficient approach
-            statements = []
-            start = 0
-            in_string = False
-            string_char = None
-            
-            i = 0
-            while i < len(clean_sql):
-                char = clean_sql[i]
-                # Handle string literals
-                if char in ("'", '"') and not in_string:
-                    in_string = True
-                    string_char = char
-                elif char == string_char and in_string:
-                    # Check for escaped quotes (doubled quotes)
-                    if i + 1 < len(clean_sql) and clean_sql[i + 1] == string_char:
-                        i += 1  # Skip the escaped quote
-                    else:
-                        in_string = False
-                        string_char = None
-                
-                # Handle semicolons
-                elif char == ';' and not in_string:
-                    stmt = clean_sql[start:i].strip()
-                    if stmt:
-                        statements.append(stmt)
-                    start = i + 1
-                
-                i += 1
-            
-            # Add final statement if exists
-            stmt = clean_sql[start:].strip()
-            if stmt:
-                statements.append(stmt)
-            
-            return statements
+            return [(stmt, self._leading_keyword(stmt))
+                    for stmt in self._iter_statements(self._strip_comments(sql_content))]
         except (TypeError, ValueError) as e:
             print(f"❌ Error parsing SQL statements: {e}")
             raise  # Propagate error to caller
     
-    def _validate_file_path(self, file_path: str) -> Optional[Path]:
+    def _extract_statements(self, sql_content: str) -> List[Tuple[str, str]]:
+        """Split SQL content into (statement, leading keyword) pairs with DuckDB's own parser"""
+        try:
+            extracted = self.conn.extract_statements(sql_content)
+        except duckdb.Error:
+            # A file that doesn't parse is split by hand, so the statements before the bad one still run
+            # and the error is reported against the statement that caused it
+            return self._split_sql_statements(sql_content)
+        
+        statements = []
+        for extracted_statement in extracted:
+            # The statement text starts with any comments in front of it (and the last one keeps its
+            # semicolon); skip past them for keyword checks and INSERT merging
+            query = extracted_statement.query
+            stmt = query[_LEADING_COMMENTS_RE.match(query).end():].rstrip().rstrip(';').rstrip()
+            if stmt:
+                statements.append((stmt, self._leading_keyword(stmt)))
+        return statements
+    
+    @staticmethod
+    def _strip_comments(sql_content: str) -> str:
+        """Remove -- and /* */ comments and blank lines ahead of statement splitting"""
+        # Remove comments (keeping the part of a line before an inline comment), then blank lines;
+        # both passes run inside the regex engine rather than a Python loop over characters
+        if '--' in sql_content or '/*' in sql_content:
+            clean_sql = _COMMENT_RE.sub(lambda m: m.group(1) or '', sql_content)
+        else:
+            clean_sql = sql_content
+        return _BLANK_LINES_RE.sub('', clean_sql).strip()
+    
+    @staticmethod
+    def _iter_statements(clean_sql: str) -> Iterator[str]:
+        """Lazily yield the non-empty statements of comment-stripped SQL, so callers can stop early"""
+        # Without a semicolon there is at most one statement, so skip the scanner
+        if ';' not in clean_sql:
+            if clean_sql:
+                yield clean_sql
+            return
+        
+        # Split by semicolon, matching statement by statement in the regex engine
+        for match in _STATEMENT_RE.finditer(clean_sql):
+            stmt = match.group(0).strip()
+            if stmt:
+                yield stmt
+    
+    @staticmethod
+    def _leading_keyword(statement: str) -> str:
+        """Return the uppercased first keyword of a stripped statement, or '' if there is none"""
+        match = _KEYWORD_RE.match(statement)
+        return match.group(0).upper() if match else ''
+    
+    def _validate_file_path(self, file_path: str) -> Optional[str]:
         """Validate and resolve file path to prevent path traversal"""
         try:
             # Resolve the path to its canonical form
-            file_path_obj = Path(file_path).resolve()
-            
-            # Define allowed base directories (current working directory and subdirectories)
-            allowed_base = Path.cwd().resolve()
+            allowed_base = str(_resolved_cwd())
+            resolved_path = _resolve_path(file_path, allowed_base)
             
-            # Check if the resolved path is within the allowed directory
-            try:
-                file_path_obj.relative_to(allowed_base)
-            except ValueError:
+            # Check if the resolved path is within the allowed directory (current working directory
+            # and subdirectories) with a plain prefix comparison on the canonical strings
+            if not _is_within(resolved_path, allowed_base):
                 print(f"❌ Access denied: {file_path} (outside allowed directory)")
                 return None
-                
-            if not file_path_obj.exists():
-                print(f"❌ File not found: {file_path}")
-                return None
-                
-            if not file_path_obj.is_file():
-                print(f"❌ Not a file: {file_path}")
+            
+            # Existence is checked on every call (files come and go); one stat when the file is there
+            if not os.path.isfile(resolved_path):
+                if not os.path.exists(resolved_path):
+                    print(f"❌ File not found: {file_path}")
+                else:
+                    print(f"❌ Not a file: {file_path}")
                 return None
                 
-            return file_path_obj
+            return resolved_path
                 
         except Exception as e:
             print(f"❌ Invalid file path: {file_path} - {e}")
             return None
     
-    def execute_file(self, file_path: str) -> None:
-        """Execute SQL commands from a file"""
+    def execute_file(self, file_path: str, report: bool = True) -> None:
+        """Execute SQL commands from a file, reporting each statement unless report is False"""
         resolved_path = self._validate_file_path(file_path)
         if not resolved_path:
             return
-            
-        print(f"📄 Executing: {resolved_path}")
+        self._execute_resolved_file(resolved_path, report)
+    
+    def execute_files(self, file_paths: List[str]) -> None:
+        """Execute several SQL files in order, reading the later ones while earlier ones run"""
+        resolved_paths = [path for path in map(self._validate_file_path, file_paths) if path]
+        if len(resolved_paths) <= 1:
+            for resolved_path in resolved_paths:
+                self._execute_resolved_file(resolved_path)
+            return
         
-        try:
-            with resolved_path.open('r', encoding='utf-8') as f:
-                sql_content = f.read()
-            
-            # Split by semicolon and execute each statement
-            statements = self._split_sql_statements(sql_content)
-            
-            for i, statement in enumerate(statements, 1):
+        # Reads run ahead in threads; statements still execute one file at a time on this runner's connection
+        with ThreadPoolExecutor(max_workers=_READ_AHEAD_WORKERS) as pool:
+            futures = [pool.submit(self._read_sql_file, path) for path in resolved_paths]
+            for resolved_path, future in zip(resolved_paths, futures):
                 try:
-                    result = self.conn.execute(statement)
-                    
-                    # If it's a SELECT statement, show results
-                    if statement.upper().strip().startswith('SELECT'):
-                        rows = result.fetchmany(10)  # Fetch exactly 10 rows
-                        if rows:
-                            # Use efficient string formatting with single print
-                            row_output = [f"  Query {i} results:"] + [f"    {row}" for row in rows]
-                            if len(rows) == 10:
-                                row_output.append("    ... (more rows may be available)")
-                            print("\n".join(row_output))
-                        else:
-                            print(f"  Query {i}: No results")
-                    else:
-                        print(f"  ✅ Statement {i} executed successfully")
-                        
-                except duckdb.Error as e:
-                    print(f"  ❌ SQL Error in statement {i}: {e}")
-                    continue
+                    sql_content = future.result()
                 except Exception as e:
-                    print(f"  ❌ Unexpected error in statement {i}: {type(e).__name__}: {e}")
+                    print(f"📄 Executing: {resolved_path}")
+                    print(f"❌ Error reading file: {e}")
                     continue
+                self._execute_resolved_file(resolved_path, sql_content=sql_content)
+    
+    def _execute_resolved_file(self, resolved_path: str, report: bool = True,
+                               sql_content: Optional[str] = None) -> None:
+        """Execute a validated SQL file, using its already-read content when given"""
+        print(f"📄 Executing: {resolved_path}")
+        
+        if not report:
+            # Hand the whole script to DuckDB's parser in one call; it stops at the first failing statement
+            try:
+                if sql_content is None:
+                    sql_content = self._read_sql_file(resolved_path)
+                self._execute_script(sql_content)
+                print("  ✅ File executed successfully")
+            except duckdb.Error as e:
+                print(f"  ❌ SQL Error: {e}")
+            except Exception as e:
+                print(f"❌ Error reading file: {e}")
+            return
+        
+        try:
+            # Split by semicolon and execute each statement, grouping runs into transactions
+            statements = self._parse_sql_file(resolved_path, sql_content)
+            
+            # Reports are collected and written once at the end instead of a print per statement
+            out = []
+            group = []
+            for i, (statement, keyword) in enumerate(statements, 1):
+                if keyword in _NON_TRANSACTIONAL_KEYWORDS:
+                    out.extend(self._execute_group(group))
+                    group = []
+                    out.append(self._report_statement(i, statement, keyword))
+                else:
+                    group.append((i, statement, keyword))
+            out.extend(self._execute_group(group))
+            if out:
+                sys.stdout.write("\n".join(out) + "\n")
+                sys.stdout.flush()
                     
         except Exception as e:
             print(f"❌ Error reading file: {e}")
     
+    def _transaction_open(self) -> bool:
+        """Whether an explicit transaction is open on this cursor, checked without side effects"""
+        # A failed BEGIN would abort the open transaction, so compare transaction ids instead:
+        # each autocommitted statement gets a new one, while inside BEGIN ... COMMIT it stays the same
+        try:
+            first_id = self.conn.execute("SELECT current_transaction_id()").fetchone()[0]
+            return self.conn.execute("SELECT current_transaction_id()").fetchone()[0] == first_id
+        except duckdb.Error:
+            return True  # Only an aborted transaction rejects a query this simple
+    
+    def _execute_script(self, sql_content: str) -> None:
+        """Execute a multi-statement script in one transaction, or as written if that isn't possible"""
+        if self._transaction_open():
+            self.conn.execute(sql_content)  # Already inside a transaction
+            return
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            self.conn.execute(sql_content)
+        except duckdb.Error:
+            # The script failed or manages its own transactions: undo it and rerun it as written,
+            # which applies what it can and raises the error of the failing statement
+            try:
+                self.conn.execute("ROLLBACK")
+            except duckdb.Error:
+                pass
+            self.conn.execute(sql_content)
+            return
+        try:
+            self.conn.execute("COMMIT")
+        except duckdb.Error:
+            pass  # The script ended the transaction itself
+    
+    def _parse_sql_file(self, path: str, sql_content: Optional[str] = None) -> List[Tuple[str, str]]:
+        """Split a SQL file into statements, reusing the result while the file is unchanged"""
+        stat = os.stat(path)
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        statements = self._parse_cache.get(key)
+        if statements is None:
+            if sql_content is None:
+                sql_content = self._read_sql_file(path)
+            statements = self._extract_statements(sql_content)
+            self._parse_cache[key] = statements
+            if len(self._parse_cache) > _PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        else:
+            self._parse_cache.move_to_end(key)
+        return statements
+    
+    @staticmethod
+    def _read_sql_file(path: str) -> str:
+        """Read a SQL file by decoding its memory-mapped pages straight into one string"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ''  # Empty files can't be mapped
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                content = str(mapped, 'utf-8')
+        if '\r' in content:
+            # Match text-mode reads, whose universal newlines turn CRLF and lone CR into LF
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
+    def _run_statement(self, i: int, statement: str, keyword: str) -> str:
+        """Execute one statement and return its report text; errors propagate to the caller"""
+        result = self.conn.execute(statement)
+        
+        # If it's a SELECT statement, show results
+        if keyword == 'SELECT':
+            rows = result.fetchmany(10)  # Fetch exactly 10 rows
+            if rows:
+                # Use efficient string formatting with single print
+                row_output = [f"  Query {i} results:"] + [f"    {row}" for row in rows]
+                if len(rows) == 10:
+                    row_output.append("    ... (more rows may be available)")
+                return "\n".join(row_output)
+            return f"  Query {i}: No results"
+        return f"  ✅ Statement {i} executed successfully"
+    
+    def _report_statement(self, i: int, statement: str, keyword: str) -> str:
+        """Execute one statement on its own and return its report or error text"""
+        try:
+            return self._run_statement(i, statement, keyword)
+        except duckdb.Error as e:
+            return f"  ❌ SQL Error in statement {i}: {e}"
+        except Exception as e:
+            return f"  ❌ Unexpected error in statement {i}: {type(e).__name__}: {e}"
+    
+    def _execute_group(self, group: List[Tuple[int, str, str]]) -> List[str]:
+        """Execute (index, statement, keyword) entries in one transaction, else one by one; returns reports"""
+        # Inside a transaction the file opened itself, statements run as they come
+        if len(group) > 1 and not self._transaction_open():
+            self.conn.execute("BEGIN TRANSACTION")
+            try:
+                reports = []
+                for i, count, statement, keyword in self._merge_inserts(group):
+                    if count == 1:
+                        reports.append(self._run_statement(i, statement, keyword))
+                    else:
+                        self.conn.execute(statement)
+                        reports.append(f"  ✅ Statements {i}-{i + count - 1}: "
+                                       f"{count} INSERTs executed as one statement")
+                self.conn.execute("COMMIT")
+                return reports
+            except Exception:
+                # DuckDB aborts the transaction on any error: undo it and replay statement
+                # by statement so the failure is reported and the other statements still apply
+                self.conn.execute("ROLLBACK")
+        return [self._report_statement(i, statement, keyword) for i, statement, keyword in group]
+    
+    @staticmethod
+    def _merge_inserts(group: List[Tuple[int, str, str]]) -> List[Tuple[int, int, str, str]]:
+        """Merge adjacent INSERT ... VALUES entries on one table into (index, count, statement, keyword) units"""
+        units = []
+        merged_key = None
+        for i, statement, keyword in group:
+            # DuckDB's parser leaves inline comments in the statement text; strip them (outside literals)
+            # first, or rows appended after a trailing -- comment would be commented out
+            if keyword == 'INSERT' and ('--' in statement or '/*' in statement):
+                match = _INSERT_VALUES_RE.match(SQLRunner._strip_comments(statement))
+            else:
+                match = _INSERT_VALUES_RE.match(statement) if keyword == 'INSERT' else None
+            if match is None or _INSERT_TRAILER_RE.search(match.group(2)):
+                units.append([i, 1, statement, keyword, None])
+                merged_key = None
+                continue
+            key = ' '.join(match.group(1).lower().split())
+            if key == merged_key:
+                units[-1][1] += 1
+                units[-1][4].append(match.group(2))
+            else:
+                units.append([i, 1, statement, keyword, [match.group(1), match.group(2)]])
+                merged_key = key
+        # Parsing each merged run once lets DuckDB insert all its rows in a single statement
+        return [(i, count, f"INSERT INTO {parts[0]} VALUES {', '.join(parts[1:])}" if count > 1 else statement,
+                 keyword) for i, count, statement, keyword, parts in units]
+    
     def setup_database(self, setup_file: str = "database/tpc-h.sql") -> None:
         """Run the tpc-h.sql file to initialize the database"""
         print("🔧 Setting up database...")
@@ -182,7 +477,7 @@ class SQLRunner:
         if not validated_path:
             print("❌ Database setup failed: Invalid setup file path")
             return
-        self.execute_file(str(validated_path))
+        self.execute_file(validated_path, report=False)
     
     def setup_starwars(self) -> None:
         """Create the Star Wars database using swapi_database.sql"""
@@ -192,41 +487,38 @@ class SQLRunner:
             data_dir = Path("data")
             data_dir.mkdir(exist_ok=True)
             
-            # Create a separate connection for the Star Wars database
-            starwars_conn = duckdb.connect("data/databases/starwars.db")
+            # Attach the Star Wars database to the existing connection instead of opening a new one
+            original_db = self.conn.execute("SELECT current_database()").fetchone()[0]
+            attached = original_db != "starwars"  # The runner may already be connected to starwars.db
+            if attached:
+                self.conn.execute("ATTACH 'data/databases/starwars.db' AS starwars")
             
             # Temporarily switch to the Star Wars database
-            original_conn = self.conn
-            self.conn = starwars_conn
-            
-            # Execute the Star Wars database script
-            self.execute_file("database/starwars.sql")
-            
-            # Close the Star Wars connection and restore original
-            starwars_conn.close()
-            self.conn = original_conn
+            self.conn.execute("USE starwars")
+            try:
+                # Execute the Star Wars database script
+                self.execute_file("database/starwars.sql", report=False)
+            finally:
+                # Switch back and release the Star Wars database file
+                self.conn.execute(f'USE "{original_db}"')
+                if attached:
+                    self.conn.execute("DETACH starwars")
             
             print("✅ Star Wars database created as data/databases/starwars.db")
             
         except Exception as e:
             print(f"❌ Error creating Star Wars database: {e}")
-            # Restore original connection if something went wrong
-            self.conn = original_conn if 'original_conn' in locals() else self.conn
     
     def list_tables(self) -> None:
         """List all tables in the database"""
         try:
-            query = (
-                "SELECT table_name FROM information_schema.tables "
-                "WHERE table_schema = 'main' ORDER BY table_name"
-            )
-            result = self.conn.execute(query)
+            result = self.conn.execute(_LIST_TABLES_SQL)
             tables = result.fetchall()
             
             if tables:
-                print("📊 Available tables:")
-                for table in tables:
-                    print(f"  - {table[0]}")
+                # One write for the whole listing rather than a print per table
+                out = ["📊 Available tables:"] + [f"  - {table[0]}" for table in tables]
+                sys.stdout.write("\n".join(out) + "\n")
             else:
                 print("📊 No tables found")
                 
@@ -239,28 +531,47 @@ class SQLRunner:
             print("🧹 Cleaning database...")
             
             # Get all tables
-            query = (
-                "SELECT table_name FROM information_schema.tables "
-                "WHERE table_schema = 'main' ORDER BY table_name"
-            )
-            result = self.conn.execute(query)
+            result = self.conn.execute(_LIST_TABLES_SQL)
             tables = result.fetchall()
             
             if not tables:
                 print("📊 Database is already clean (no tables found)")
                 return
             
-            # Drop each table
-            for table in tables:
-                table_name = table[0]
-                try:
-                    # Use identifier quoting to prevent SQL injection
-                    self.conn.execute(f'DROP TABLE IF EXISTS "{table_name}"')
-                    print(f"  ✅ Dropped table: {table_name}")
-                except Exception as e:
-                    print(f"  ❌ Error dropping table {table_name}: {e}")
+            # Use identifier quoting (with embedded quotes doubled) to prevent SQL injection
+            table_names = [table[0] for table in tables]
+            drops = []
+            for table_name in table_names:
+                quoted_name = table_name.replace('"', '""')
+                drops.append(f'DROP TABLE IF EXISTS "{quoted_name}"')
             
-            print("✅ Database cleaned successfully")
+            # Drop every table in one script and one commit; if any drop fails, undo and go table by table
+            try:
+                self.conn.execute("BEGIN TRANSACTION")
+            except duckdb.Error:
+                dropped_all = False  # Already inside a transaction
+            else:
+                try:
+                    self.conn.execute(";\n".join(drops))
+                    self.conn.execute("COMMIT")
+                    dropped_all = True
+                except duckdb.Error:
+                    self.conn.execute("ROLLBACK")
+                    dropped_all = False
+            
+            # Reports are collected and written once at the end instead of a print per table
+            out = []
+            if dropped_all:
+                out.extend(f"  ✅ Dropped table: {table_name}" for table_name in table_names)
+            else:
+                for table_name, drop in zip(table_names, drops):
+                    try:
+                        self.conn.execute(drop)
+                        out.append(f"  ✅ Dropped table: {table_name}")
+                    except Exception as e:
+                        out.append(f"  ❌ Error dropping table {table_name}: {e}")
+            out.append("✅ Database cleaned successfully")
+            sys.stdout.write("\n".join(out) + "\n")
                 
         except Exception as e:
             print(f"❌ Error cleaning database: {e}")
@@ -275,38 +586,37 @@ class SQLRunner:
                 raise ValueError("Query cannot be empty")
             
             # Enhanced SQL injection protection
-            query_upper = query.upper().strip()
-            
-            # Check for multiple statements (semicolon not in quotes)
-            statements = self._split_sql_statements(query)
-            if len(statements) > 1:
+            # Check for multiple statements (semicolon not in quotes); the scan stops at the second one
+            statements = self._iter_statements(self._strip_comments(query))
+            first_statement = next(statements, None)
+            if next(statements, None) is not None:
                 print("❌ Multiple SQL statements not allowed in query mode. Use file execution instead.")
                 return
             
             # Only allow SELECT statements in query mode
-            if not query_upper.startswith('SELECT'):
+            if first_statement is None or self._leading_keyword(first_statement) != 'SELECT':
                 print("❌ Only SELECT statements allowed in query mode. Use file execution for other commands.")
                 return
             
             # Additional validation: ensure no SQL keywords that could be dangerous
-            dangerous_keywords = ['UNION', 'INTO', 'OUTFILE', 'DUMPFILE', 'LOAD_FILE']
-            if any(keyword in query_upper for keyword in dangerous_keywords):
+            if _DANGEROUS_KEYWORDS_RE.search(query):
                 print("❌ Query contains restricted keywords. Use file execution instead.")
                 return
             
             result = self.conn.execute(query)
             
-            # Since we only allow SELECT, we know this is a query
-            columns = []
-            if hasattr(result, 'description') and result.description:
-                columns = [desc[0] for desc in result.description]
-            
-            # Fetch rows and format efficiently
-            rows = result.fetchmany(10000)
-            if rows:
-                # Use list comprehension and join for better performance
-                formatted_rows = [" | ".join(str(val) for val in row) for row in rows]
-                print("\n".join(formatted_rows))
+            # Since we only allow SELECT, we know this is a query; show at most 10000 rows
+            if pa is not None:
+                batch = next(iter(result.fetch_record_batch(10000)), None)
+                formatted_rows = self._format_arrow_rows(batch) if batch is not None else []
+            else:
+                rows = result.fetchmany(10000)
+                formatted_rows = [" | ".join(map(str, row)) for row in rows]
+            if formatted_rows:
+                # One write for the whole result rather than a print (and stdout lock) per line
+                formatted_rows.append(f"({len(formatted_rows)} rows)")
+                sys.stdout.write("\n".join(formatted_rows) + "\n")
+                sys.stdout.flush()
             else:
                 print("No results")
                 
@@ -315,75 +625,67 @@ class SQLRunner:
         except Exception as e:
             print(f"❌ Error executing query: {e}")
     
-    def find_sql_files(self, directory: str = ".") -> List[str]:
-        """Find all SQL files in directory and subdirectories"""
+    @staticmethod
+    def _format_arrow_rows(batch) -> List[str]:
+        """Render an Arrow record batch as ' | '-joined rows, converting whole columns to text at once"""
+        columns = []
+        for column in batch.columns:
+            try:
+                columns.append(pc.fill_null(pc.cast(column, pa.string()), 'None').to_pylist())
+            except pa.ArrowNotImplementedError:
+                # Nested types (lists, structs, maps) have no string cast
+                columns.append([str(value) for value in column.to_pylist()])
+        return [" | ".join(row) for row in zip(*columns)]
+    
+    def find_sql_files(self, directory: str = ".", limit: Optional[int] = None) -> List[str]:
+        """Find SQL files in directory and subdirectories, in order; only the first limit if given"""
         try:
-            resolved_dir = Path(directory).resolve()
-            current_dir = Path.cwd().resolve()
-            
-            # Validate directory is within current working directory
-            resolved_dir.relative_to(current_dir)  # Raises ValueError if outside
-                
-        except ValueError:
-            print(f"❌ Access denied: Directory path outside allowed directory: {directory}")
-            return []
-        except (OSError, TypeError) as e:
+            resolved_dir = os.path.realpath(directory)
+            current_dir = str(_resolved_cwd())
+        except (OSError, TypeError, ValueError) as e:
             print(f"❌ Invalid directory path: {directory} - {e}")
             return []
+        
+        # Validate directory is within current working directory
+        if not _is_within(resolved_dir, current_dir):
+            print(f"❌ Access denied: Directory path outside allowed directory: {directory}")
+            return []
             
-        sql_files = []
-        for root, dirs, files in os.walk(resolved_dir, followlinks=False):
-            for file in files:
-                if file.endswith('.sql'):
-                    file_path = Path(root) / file
-                    try:
-                        # Ensure each file is within the allowed directory
-                        resolved_file = file_path.resolve()
-                        resolved_file.relative_to(current_dir)
-                        # Store relative path for user-friendly display
-                        relative_path = resolved_file.relative_to(current_dir)
-                        sql_files.append(str(relative_path))
-                    except ValueError:
-                        # Skip files outside allowed directory
-                        continue
+        # The walk stays under resolved_dir and skips symlinks (which may point outside the tree),
+        # so each path is made relative by cutting off the working directory prefix
+        prefix_length = len(os.path.join(current_dir, ''))
+        sql_files = (path[prefix_length:] for path in _walk_sql_files(resolved_dir))
+        if limit is not None:
+            return heapq.nsmallest(limit, sql_files)  # Keeps only limit paths instead of sorting them all
         return sorted(sql_files)
     
     def _show_help(self) -> None:
         """Show help message"""
-        print("Commands:")
-        print("  setup    - Run tpc-h.sql")
-        print("  starwars - Create Star Wars database")
-        print("  clean    - Drop all tables")
-        print("  tables   - List all tables")
-        print("  files    - List available SQL files")
-        print("  run <file> - Execute SQL file")
-        print("  query <sql> - Execute SQL query")
-        print("  help     - Show this help message")
-        print("  quit/exit - Exit")
-    
-    def _handle_run_command(self, command: str) -> None:
+        sys.stdout.write(_HELP_TEXT)
+    
+    def _handle_run_command(self, argument: str) -> None:
         """Handle run command"""
-        parts = command.split(maxsplit=1)
-        if len(parts) > 1:
-            file_input = parts[1].strip()
-            if not file_input:
-                print("❌ Please specify a file to run")
-            else:
-                self.execute_file(file_input)
-        else:
+        if not argument:
             print("❌ Please specify a file to run")
+        else:
+            self.execute_file(argument)
     
-    def _handle_query_command(self, command: str) -> None:
+    def _handle_query_command(self, argument: str) -> None:
         """Handle query command"""
-        parts = command.split(maxsplit=1)
-        if len(parts) > 1:
-            query_input = parts[1].strip()
-            if not query_input:
-                print("❌ Please specify a query to execute")
-            else:
-                self.run_query(query_input)
-        else:
+        if not argument:
             print("❌ Please specify a query to execute")
+        else:
+            self.run_query(argument)
+    
+    def _list_files(self) -> None:
+        """Handle files command"""
+        # Ask for one more file than is shown to know whether there are more
+        files = self.find_sql_files(limit=_FILES_SHOWN + 1)
+        out = ["📁 Available SQL files:"]
+        out.extend(f"  {i}. {file}" for i, file in enumerate(files[:_FILES_SHOWN], 1))
+        if len(files) > _FILES_SHOWN:
+            out.append("  ... (more available)")
+        sys.stdout.write("\n".join(out) + "\n")
     
     def interactive_mode(self) -> None:
         """Run in interactive mode"""
@@ -391,33 +693,33 @@ class SQLRunner:
         self._show_help()
         print()
         
+        # Commands are looked up by name instead of testing each one in turn
+        commands = {
+            "setup": self.setup_database,
+            "starwars": self.setup_starwars,
+            "clean": self.clean_database,
+            "tables": self.list_tables,
+            "files": self._list_files,
+            "help": self._show_help,
+        }
+        argument_commands = {
+            "run": self._handle_run_command,
+            "query": self._handle_query_command,
+        }
+        
         while True:
             try:
                 command = input("sql> ").strip()
+                if not command:
+                    continue
                 
-                if command in ("quit", "exit"):
+                name, argument = _COMMAND_RE.match(command).groups()
+                if argument is None and name in ("quit", "exit"):
                     break
-                elif command == "setup":
-                    self.setup_database()
-                elif command == "starwars":
-                    self.setup_starwars()
-                elif command == "clean":
-                    self.clean_database()
-                elif command == "tables":
-                    self.list_tables()
-                elif command == "files":
-                    files = self.find_sql_files()
-                    print("📁 Available SQL files:")
-                    for i, file in enumerate(files, 1):
-                        print(f"  {i}. {file}")
-                elif command == "help":
-                    self._show_help()
-                elif command.startswith("run "):
-                    self._handle_run_command(command)
-                elif command.startswith("query "):
-                    self._handle_query_command(command)
-                elif command == "":
-                    continue
+                elif argument is None and name in commands:
+                    commands[name]()
+                elif name in argument_commands:
+                    argument_commands[name](argument or "")
                 else:
                     print("❌ Unknown command")
                     
@@ -428,7 +730,7 @@ class SQLRunner:
                 break
     
     def close(self) -> None:
-        """Close database connection"""
+        """Close this runner's cursor; the shared database connection stays open for other runners"""
         try:
             if self.conn:
                 self.conn.close()
@@ -440,7 +742,7 @@ def main():
     parser = argparse.ArgumentParser(description="SQL Runner for DuckDB")
     parser.add_argument("--db", default="data/databases/tpc-h.db", help="Database file path")
     parser.add_argument("--setup", action="store_true", help="Run setup.sql first")
-    parser.add_argument("--file", help="SQL file to execute")
+    parser.add_argument("--file", nargs="+", help="SQL file(s) to execute, in order")
     parser.add_argument("--query", help="SQL query to execute")
     parser.add_argument("--interactive", "-i", action="store_true", help="Run in interactive mode")
     
@@ -458,7 +760,7 @@ def main():
             runner.setup_database()
         
         if args.file:
-            runner.execute_file(args.file)
+            runner.execute_files(args.file)
         
         if args.query:
             runner.run_query(args.query)
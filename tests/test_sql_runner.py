@@ -0,0 +1,73 @@
+"""Regression tests for sql_runner.SQLRunner"""
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sql_runner import SQLRunner
+
+
+def test_merged_inserts_keep_rows_after_trailing_comments(tmp_path, monkeypatch):
+    """Adjacent INSERTs are merged without commenting out rows that follow an inline comment"""
+    monkeypatch.chdir(tmp_path)
+    seed_file = tmp_path / "seed.sql"
+    seed_file.write_text(
+        "CREATE TABLE t (id INTEGER, v VARCHAR);\n"
+        "INSERT INTO t VALUES (1, 'a'),\n"
+        " (2, 'b') -- seed rows (v1)\n"
+        ";\n"
+        "INSERT INTO t VALUES (3, 'c'); INSERT INTO t VALUES (4, 'd') /* trailing */;\n"
+        "INSERT INTO t VALUES (5, 'e -- not a comment');\n"
+    )
+    
+    runner = SQLRunner(os.path.join(tmp_path, "test.db"))
+    try:
+        runner.execute_file(str(seed_file))
+        rows = runner.conn.execute("SELECT id, v FROM t ORDER BY id").fetchall()
+    finally:
+        runner.close()
+    
+    assert rows == [(1, 'a'), (2, 'b'), (3, 'c'), (4, 'd'), (5, 'e -- not a comment')]
+
+
+def test_statements_inside_a_script_transaction_are_applied(tmp_path, monkeypatch):
+    """A BEGIN ... COMMIT block in a file runs as written, without the runner aborting it"""
+    monkeypatch.chdir(tmp_path)
+    script_file = tmp_path / "transfer.sql"
+    script_file.write_text(
+        "CREATE TABLE accounts (id INTEGER, balance INTEGER);\n"
+        "INSERT INTO accounts VALUES (1, 100), (2, 50);\n"
+        "BEGIN TRANSACTION;\n"
+        "UPDATE accounts SET balance = balance - 30 WHERE id = 1;\n"
+        "UPDATE accounts SET balance = balance + 30 WHERE id = 2;\n"
+        "COMMIT;\n"
+    )
+    
+    runner = SQLRunner(os.path.join(tmp_path, "test.db"))
+    try:
+        runner.execute_file(str(script_file))
+        rows = runner.conn.execute("SELECT id, balance FROM accounts ORDER BY id").fetchall()
+    finally:
+        runner.close()
+    
+    assert rows == [(1, 70), (2, 80)]
+
+
+def test_crlf_line_endings_are_read_as_newlines(tmp_path, monkeypatch):
+    """Windows line endings don't leak carriage returns into string literals"""
+    monkeypatch.chdir(tmp_path)
+    script_file = tmp_path / "crlf.sql"
+    script_file.write_bytes(
+        b"CREATE TABLE notes (body VARCHAR);\r\n"
+        b"INSERT INTO notes VALUES ('line one\r\nline two');\r\n"
+    )
+    
+    runner = SQLRunner(os.path.join(tmp_path, "test.db"))
+    try:
+        runner.execute_file(str(script_file))
+        rows = runner.conn.execute("SELECT body FROM notes").fetchall()
+    finally:
+        runner.close()
+    
+    assert rows == [('line one\nline two',)]
@@ -0,0 +1,29 @@
+"""
+Shared JSON file helpers for the SWAPI tools
+Uses orjson when it is installed and falls back to the standard json module
+"""
+import json
+
+# orjson is an optional, faster drop-in for loading and saving the SWAPI files
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json_file(filepath):
+    """Parse a JSON file from a single bulk read"""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def save_json_file(data, filepath):
+    """Write data as 2-space indented UTF-8 JSON, serialized in one call"""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        # ensure_ascii=False matches orjson, which writes non-ASCII characters as UTF-8
+        with open(filepath, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, indent=2, ensure_ascii=False))
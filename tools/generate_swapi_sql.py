@@ -6,115 +6,128 @@ This script reads SWAPI JSON data and generates CREATE TABLE and INSERT statemen
 import json
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from _jsonio import load_json_file
 
+# Trailing numeric ID of a SWAPI URL, e.g. https://swapi.info/api/people/1
+_URL_ID_RE = re.compile(r'/(\d+)/?$')
+
+
+@lru_cache(maxsize=8192)
 def extract_id_from_url(url):
-    """Extract ID from SWAPI URL"""
-    match = re.search(r'/(\d+)/?$', url)
+    """Extract ID from SWAPI URL (each URL recurs across many junction rows, so results are cached)"""
+    match = _URL_ID_RE.search(url)
     return int(match.group(1)) if match else None
 
 
+# Numeric columns whose SWAPI values may arrive as strings ("1,000", "30-165", "unknown")
+_NUMERIC_COLUMNS = frozenset({
+    'cost_in_credits', 'cargo_capacity', 'length', 'hyperdrive_rating',
+    'diameter', 'rotation_period', 'orbital_period', 'surface_water',
+    'crew', 'passengers', 'max_atmosphering_speed', 'MGLT', 'population', 'episode_id',
+})
+
+# Fields left out of CREATE TABLE: the id (declared first) and many-to-many relationships.
+# One-to-many fields (homeworld) are kept so they can become foreign keys
+_SCHEMA_EXCLUDED_FIELDS = frozenset({
+    'id', 'films', 'characters', 'planets', 'species', 'vehicles', 'starships',
+    'pilots', 'residents', 'people'
+})
+
+# SQL type of the numeric columns; every other scalar column is VARCHAR(500)
+_COL_TYPE_MAP = {
+    'cost_in_credits': 'BIGINT', 'cargo_capacity': 'BIGINT', 'population': 'BIGINT',
+    'length': 'DECIMAL', 'hyperdrive_rating': 'DECIMAL', 'diameter': 'DECIMAL',
+    'rotation_period': 'DECIMAL', 'orbital_period': 'DECIMAL', 'surface_water': 'DECIMAL',
+    'crew': 'INTEGER', 'passengers': 'INTEGER', 'max_atmosphering_speed': 'INTEGER',
+    'MGLT': 'INTEGER', 'episode_id': 'INTEGER',
+}
+
+# An integer, or a decimal number with an optional exponent, as int()/float() would accept them
+_NUMBER_RE = re.compile(r'\+?(?:\d+|(?:\d+\.\d*|\.\d+)(?:[eE]\+?\d+)?)')
+
+
+def sql_string_literal(text):
+    """Quote text as a SQL string literal, escaping single quotes only when it has any"""
+    if "'" not in text:
+        return "'" + text + "'"
+    return "'" + text.replace("'", "''") + "'"
+
+
 def sanitize_sql_value(value, column_name=None):
     """Sanitize values for SQL insertion"""
     if value is None or value == 'unknown' or value == 'n/a' or value == 'none':
         return 'NULL'
     elif isinstance(value, str):
         # Handle numeric fields that might have string values
-        if column_name and column_name in ['cost_in_credits', 'cargo_capacity', 'length', 'hyperdrive_rating', 
-                                          'diameter', 'rotation_period', 'orbital_period', 'surface_water',
-                                          'crew', 'passengers', 'max_atmosphering_speed', 'MGLT', 'population', 'episode_id']:
-            # Try to convert to number, return NULL if not possible
-            try:
-                # Remove commas and handle ranges
-                clean_value = value.replace(',', '').split('-')[0].strip()
-                if clean_value.lower() in ['unknown', 'n/a', 'none', 'indefinite']:
-                    return 'NULL'
-                # Try to parse as number
-                if '.' in clean_value:
-                    float(clean_value)
-                else:
-                    int(clean_value)
-                return clean_value
-            except (ValueError, AttributeError):
-                return 'NULL'
+        if column_name in _NUMERIC_COLUMNS:
+            # Remove commas and handle ranges (keep the lower bound)
+            clean_value = value.replace(',', '').partition('-')[0].strip()
+            # Keep it if it reads as a number; anything else ('unknown', 'indefinite', ...) is NULL
+            return clean_value if _NUMBER_RE.fullmatch(clean_value) else 'NULL'
         # Escape single quotes and wrap in quotes
-        return f"'{value.replace("'", "''")}'"
+        return sql_string_literal(value)
     elif isinstance(value, (int, float)):
         return str(value)
     elif isinstance(value, list):
         # Convert list to JSON string
-        return f"'{json.dumps(value).replace("'", "''")}'"
+        return sql_string_literal(json.dumps(value))
     elif isinstance(value, dict):
         # Convert dict to JSON string
-        return f"'{json.dumps(value).replace("'", "''")}'"
+        return sql_string_literal(json.dumps(value))
     else:
-        return f"'{str(value).replace("'", "''")}'"
+        return sql_string_literal(str(value))
 
 
 def generate_create_table_sql(table_name, sample_data):
     """Generate CREATE TABLE statement based on sample data"""
-    sql = f"CREATE TABLE {table_name} (\n"
-    sql += "    id INTEGER PRIMARY KEY,\n"
+    definitions = ["id INTEGER PRIMARY KEY"]
     
     # Analyze first few records to determine column types
+    head = sample_data[:5]  # Look at first 5 items
     columns = set()
-    for item in sample_data[:5]:  # Look at first 5 items
+    for item in head:
         columns.update(item.keys())
     
     # Remove 'id' and many-to-many relationship fields
-    # Keep one-to-many fields (homeworld) to be handled as foreign keys
-    exclude_fields = {
-        'id', 'films', 'characters', 'planets', 'species', 'vehicles', 'starships', 
-        'pilots', 'residents', 'people'
-    }
-    columns = {col for col in columns if col not in exclude_fields}
+    columns -= _SCHEMA_EXCLUDED_FIELDS
     
     # Always add species_id for characters table
     if table_name == 'characters':
-        sql += f"    species_id INTEGER,\n"
+        definitions.append("species_id INTEGER")
     
     for column in sorted(columns):
-        # Determine column type based on sample values
-        sample_values = [item.get(column) for item in sample_data[:5] if column in item]
-        
         # Handle homeworld as foreign key
         if column == 'homeworld':
-            sql += f"    homeworld_id INTEGER,\n"
+            definitions.append("homeworld_id INTEGER")
             continue
             
         # Skip species for characters table (already handled above)
         if column == 'species' and table_name == 'characters':
             continue
-            
-        if any(isinstance(v, list) for v in sample_values):
-            col_type = "TEXT"  # Store as JSON
-        elif any(isinstance(v, dict) for v in sample_values):
+        
+        # Determine column type based on sample values, collected in one pass
+        sample_types = {type(item[column]) for item in head if column in item}
+        
+        if list in sample_types or dict in sample_types:
             col_type = "TEXT"  # Store as JSON
-        elif column in ['cost_in_credits', 'cargo_capacity']:
-            col_type = "BIGINT"
-        elif column in ['length', 'hyperdrive_rating', 'diameter', 'rotation_period', 'orbital_period', 'surface_water']:
-            col_type = "DECIMAL"
-        elif column in ['population']:
-            col_type = "BIGINT"
-        elif column in ['crew', 'passengers', 'max_atmosphering_speed', 'MGLT', 'episode_id']:
-            col_type = "INTEGER"
         else:
-            col_type = "VARCHAR(500)"
+            col_type = _COL_TYPE_MAP.get(column, "VARCHAR(500)")
         
-        sql += f"    {column} {col_type},\n"
+        definitions.append(f"{column} {col_type}")
     
     # Add foreign key constraints at the end
     if table_name == 'characters':
-        sql += "    FOREIGN KEY (homeworld_id) REFERENCES planets(id),\n"
-        sql += "    FOREIGN KEY (species_id) REFERENCES species(id)\n"
+        definitions.append("FOREIGN KEY (homeworld_id) REFERENCES planets(id)")
+        definitions.append("FOREIGN KEY (species_id) REFERENCES species(id)")
     elif table_name == 'species':
-        sql += "    FOREIGN KEY (homeworld_id) REFERENCES planets(id)\n"
-    else:
-        sql = sql.rstrip(',\n') + "\n"
+        definitions.append("FOREIGN KEY (homeworld_id) REFERENCES planets(id)")
     
-    sql += ");\n\n"
-    return sql
+    body = ",\n    ".join(definitions)
+    return f"CREATE TABLE {table_name} (\n    {body}\n);\n\n"
 
 
 def generate_insert_sql(table_name, data):
@@ -122,7 +135,7 @@ def generate_insert_sql(table_name, data):
     if not data:
         return ""
     
-    sql = f"-- Insert data into {table_name}\n"
+    sql_parts = [f"-- Insert data into {table_name}\n"]
     
     # Define column order based on table creation order
     table_column_order = {
@@ -134,22 +147,25 @@ def generate_insert_sql(table_name, data):
         'starships': ['id', 'MGLT', 'cargo_capacity', 'consumables', 'cost_in_credits', 'created', 'crew', 'edited', 'hyperdrive_rating', 'length', 'manufacturer', 'max_atmosphering_speed', 'model', 'name', 'passengers', 'starship_class', 'url']
     }
     
+    # Exclude many-to-many relationship fields, but handle homeworld and species as foreign keys
+    exclude_fields = {
+        'films', 'characters', 'planets', 'vehicles', 'starships', 
+        'pilots', 'residents', 'people'
+    }
+    
+    # For characters table, exclude species from many-to-many (now foreign key)
+    if table_name == 'characters':
+        exclude_fields.add('species')
+    exclude_fields = frozenset(exclude_fields)
+    
+    # Use predefined column order (looked up once per table, not per row)
+    predefined_order = table_column_order.get(table_name)
+    
     for item in data:
-        # Exclude many-to-many relationship fields, but handle homeworld and species as foreign keys
-        exclude_fields = {
-            'films', 'characters', 'planets', 'vehicles', 'starships', 
-            'pilots', 'residents', 'people'
-        }
-        
-        # For characters table, exclude species from many-to-many (now foreign key)
-        if table_name == 'characters':
-            exclude_fields.add('species')
-        
         columns = []
         values = []
         
-        # Use predefined column order
-        column_order = table_column_order.get(table_name, ['id'] + sorted([k for k in item.keys() if k != 'id']))
+        column_order = predefined_order or ['id'] + sorted([k for k in item.keys() if k != 'id'])
         
         for col in column_order:
             if col in exclude_fields:
@@ -176,10 +192,10 @@ def generate_insert_sql(table_name, data):
         if columns:  # Only insert if we have columns
             column_list = ', '.join(columns)
             value_list = ', '.join(values)
-            sql += f"INSERT INTO {table_name} ({column_list}) VALUES ({value_list});\n"
+            sql_parts.append(f"INSERT INTO {table_name} ({column_list}) VALUES ({value_list});\n")
     
-    sql += "\n"
-    return sql
+    sql_parts.append("\n")
+    return ''.join(sql_parts)
 
 
 def get_id_from_item(item):
@@ -190,133 +206,93 @@ def get_id_from_item(item):
         return extract_id_from_url(item)
     return None
 
+# Junction tables filled from each parent category: (list field, junction table, parent column, child column)
+_JUNCTION_SPECS = (
+    ('films', (
+        ('characters', 'film_characters', 'film_id', 'character_id'),
+        ('planets', 'film_planets', 'film_id', 'planet_id'),
+        ('starships', 'film_starships', 'film_id', 'starship_id'),
+        ('vehicles', 'film_vehicles', 'film_id', 'vehicle_id'),
+        ('species', 'film_species', 'film_id', 'species_id'),
+    )),
+    # Character relationships (many-to-many only, homeworld and species are foreign keys)
+    ('characters', (
+        ('vehicles', 'character_vehicles', 'character_id', 'vehicle_id'),
+        ('starships', 'character_starships', 'character_id', 'starship_id'),
+    )),
+    # REMOVED: Planet and species relationships - now using characters foreign keys
+    ('vehicles', (
+        ('pilots', 'vehicle_pilots', 'vehicle_id', 'character_id'),
+    )),
+    ('starships', (
+        ('pilots', 'starship_pilots', 'starship_id', 'character_id'),
+    )),
+)
+
+# Rows per multi-row junction INSERT statement
+_JUNCTION_BATCH_SIZE = 500
+
+
 def generate_junction_table_data(all_data):
     """Generate INSERT statements for junction tables"""
-    sql = "-- JUNCTION TABLE DATA\n\n"
-    
-    # Film relationships
-    for film in all_data.get('films', []):
-        film_id = film.get('id')
-        if not film_id:
-            continue
-            
-        # Film-Characters
-        for char_item in film.get('characters', []):
-            char_id = get_id_from_item(char_item)
-            if char_id:
-                sql += f"INSERT INTO film_characters (film_id, character_id) VALUES ({film_id}, {char_id});\n"
-        
-        # Film-Planets
-        for planet_item in film.get('planets', []):
-            planet_id = get_id_from_item(planet_item)
-            if planet_id:
-                sql += f"INSERT INTO film_planets (film_id, planet_id) VALUES ({film_id}, {planet_id});\n"
-        
-        # Film-Starships
-        for starship_item in film.get('starships', []):
-            starship_id = get_id_from_item(starship_item)
-            if starship_id:
-                sql += f"INSERT INTO film_starships (film_id, starship_id) VALUES ({film_id}, {starship_id});\n"
-        
-        # Film-Vehicles
-        for vehicle_item in film.get('vehicles', []):
-            vehicle_id = get_id_from_item(vehicle_item)
-            if vehicle_id:
-                sql += f"INSERT INTO film_vehicles (film_id, vehicle_id) VALUES ({film_id}, {vehicle_id});\n"
-        
-        # Film-Species
-        for species_item in film.get('species', []):
-            species_id = get_id_from_item(species_item)
-            if species_id:
-                sql += f"INSERT INTO film_species (film_id, species_id) VALUES ({film_id}, {species_id});\n"
+    # Statements are collected in a list and joined once rather than grown with +=
+    sql_parts = ["-- JUNCTION TABLE DATA\n\n"]
     
-    # Character relationships (many-to-many only, homeworld is now a foreign key)
-    for character in all_data.get('characters', []):
-        char_id = character.get('id')
-        if not char_id:
-            continue
-        
-        # REMOVED: Character-Species - now using characters.species_id foreign key
+    for category, relationships in _JUNCTION_SPECS:
+        parents = [parent for parent in all_data.get(category, []) if parent.get('id')]
         
-        # Character-Vehicles
-        for vehicle_item in character.get('vehicles', []):
-            vehicle_id = get_id_from_item(vehicle_item)
-            if vehicle_id:
-                sql += f"INSERT INTO character_vehicles (character_id, vehicle_id) VALUES ({char_id}, {vehicle_id});\n"
-        
-        # Character-Starships
-        for starship_item in character.get('starships', []):
-            starship_id = get_id_from_item(starship_item)
-            if starship_id:
-                sql += f"INSERT INTO character_starships (character_id, starship_id) VALUES ({char_id}, {starship_id});\n"
-    
-    # REMOVED: Planet relationships - now using characters.homeworld_id foreign key
-    
-    # REMOVED: Species relationships - now using characters.species_id foreign key
-    
-    # Vehicle relationships
-    for vehicle in all_data.get('vehicles', []):
-        vehicle_id = vehicle.get('id')
-        if not vehicle_id:
-            continue
+        for field, table, parent_column, child_column in relationships:
+            # One row per resolvable reference, in parent order so the output stays reproducible
+            rows = [
+                f"({parent['id']}, {child_id})"
+                for parent in parents
+                for child_id in map(get_id_from_item, parent.get(field, []))
+                if child_id
+            ]
             
-        # Vehicle-Pilots
-        for pilot_item in vehicle.get('pilots', []):
-            char_id = get_id_from_item(pilot_item)
-            if char_id:
-                sql += f"INSERT INTO vehicle_pilots (vehicle_id, character_id) VALUES ({vehicle_id}, {char_id});\n"
+            # Emit the rows as multi-row VALUES statements instead of one INSERT per row
+            statement = f"INSERT INTO {table} ({parent_column}, {child_column}) VALUES\n    "
+            for start in range(0, len(rows), _JUNCTION_BATCH_SIZE):
+                batch = rows[start:start + _JUNCTION_BATCH_SIZE]
+                sql_parts.append(statement + ",\n    ".join(batch) + ";\n")
     
-    # Starship relationships
-    for starship in all_data.get('starships', []):
-        starship_id = starship.get('id')
-        if not starship_id:
-            continue
-            
-        # Starship-Pilots
-        for pilot_item in starship.get('pilots', []):
-            char_id = get_id_from_item(pilot_item)
-            if char_id:
-                sql += f"INSERT INTO starship_pilots (starship_id, character_id) VALUES ({starship_id}, {char_id});\n"
-    
-    sql += "\n"
-    return sql
+    sql_parts.append("\n")
+    return ''.join(sql_parts)
 
 
-def main():
-    """Generate complete SQL script for SWAPI database"""
-    data_dir = Path("data/star-wars")
-    output_file = Path("database/starwars.sql")
-    
-    # Order matters for foreign key constraints
-    categories = ['films', 'planets', 'species', 'characters', 'vehicles', 'starships']
-    
-    print("🚀 Generating SWAPI SQL database script...")
-    
-    # Start building SQL script
-    sql_script = """-- SWAPI Database Creation Script
+def write_sql_script(out, data_dir, categories):
+    """Write the SQL script section by section to out and return the loaded data"""
+    out.write("""-- SWAPI Database Creation Script
 -- Generated from Star Wars API data
 -- This script creates tables and populates them with SWAPI data
 
-"""
+""")
     
     # Load data and generate SQL for each category
     all_data = {}
     
+    # Parse all JSON files concurrently; results are consumed below in category order
+    json_files = {category: data_dir / "json" / f"{category}.json" for category in categories}
+    with ThreadPoolExecutor(max_workers=len(categories)) as executor:
+        pending = {
+            category: executor.submit(load_json_file, json_file)
+            for category, json_file in json_files.items() if json_file.exists()
+        }
+    
     for category in categories:
-        json_file = data_dir / "json" / f"{category}.json"
+        json_file = json_files[category]
         
-        if json_file.exists():
+        if category in pending:
             print(f"📄 Processing {category}...")
             
             try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = pending[category].result()
                 
                 all_data[category] = data
                 
                 # Generate CREATE TABLE
-                sql_script += f"-- {category.upper()} TABLE\n"
-                sql_script += generate_create_table_sql(category, data)
+                out.write(f"-- {category.upper()} TABLE\n")
+                out.write(generate_create_table_sql(category, data))
                 
             except Exception as e:
                 print(f"❌ Error processing {category}: {e}")
@@ -325,7 +301,7 @@ def main():
             print(f"⚠️  File not found: {json_file}")
     
     # Add junction tables BEFORE data insertion
-    sql_script += """-- JUNCTION TABLES FOR RELATIONSHIPS
+    out.write("""-- JUNCTION TABLES FOR RELATIONSHIPS
 
 -- Film relationships
 CREATE TABLE film_characters (
@@ -390,22 +366,22 @@ CREATE TABLE starship_pilots (
     PRIMARY KEY (starship_id, character_id)
 );
 
-"""
+""")
     
     # Generate INSERT statements
-    sql_script += "-- DATA INSERTION\n\n"
+    out.write("-- DATA INSERTION\n\n")
     
     for category in categories:
         if category in all_data:
             print(f"📝 Generating INSERT statements for {category}...")
-            sql_script += generate_insert_sql(category, all_data[category])
+            out.write(generate_insert_sql(category, all_data[category]))
     
     # Generate junction table data
     print("📝 Generating junction table data...")
-    sql_script += generate_junction_table_data(all_data)
+    out.write(generate_junction_table_data(all_data))
     
     # Add useful views and queries
-    sql_script += """-- USEFUL VIEWS AND QUERIES
+    out.write("""-- USEFUL VIEWS AND QUERIES
 
 -- USEFUL VIEWS
 
@@ -435,12 +411,31 @@ SELECT
 FROM films
 ORDER BY episode_id;
 
-"""
+""")
+    return all_data
+
+
+def main():
+    """Generate complete SQL script for SWAPI database"""
+    data_dir = Path("data/star-wars")
+    output_file = Path("database/starwars.sql")
+    
+    # Order matters for foreign key constraints
+    categories = ['films', 'planets', 'species', 'characters', 'vehicles', 'starships']
+    
+    print("🚀 Generating SWAPI SQL database script...")
     
-    # Write SQL script to file
+    # Stream each section to disk as it is generated instead of joining the whole script in memory;
+    # a temp file in the same directory replaces the script only once it is complete
+    temp_file = output_file.with_name(f".{output_file.name}.{os.getpid()}.tmp")
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(sql_script)
+        try:
+            with open(temp_file, 'w', encoding='utf-8', buffering=1 << 20) as out:
+                all_data = write_sql_script(out, data_dir, categories)
+            os.replace(temp_file, output_file)
+        except BaseException:
+            temp_file.unlink(missing_ok=True)
+            raise
         
         print(f"✅ SQL script generated successfully: {output_file}")
         print(f"📊 Tables created: {len(all_data)}")
@@ -2,91 +2,147 @@ import json
 import os
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from _jsonio import load_json_file, save_json_file
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def extract_id_from_url(url):
-    """Extract ID from SWAPI URL"""
-    match = re.search(r'/(\d+)/?$', url)
+# Resource type and numeric ID of a SWAPI URL, e.g. https://swapi.info/api/people/1
+_URL_TYPE_ID_RE = re.compile(r'/([a-z]+)/(\d+)/?$')
+
+# Fields that hold SWAPI URL references ('url', an item's own address, is not one of them)
+_REFERENCE_FIELDS = frozenset({
+    'films', 'characters', 'people', 'planets', 'residents', 'species',
+    'vehicles', 'starships', 'pilots', 'homeworld'
+})
+
+@lru_cache(maxsize=8192)
+def parse_swapi_url(url):
+    """Extract (type, ID) from SWAPI URL, or (None, None); the same URLs recur, so results are cached"""
+    match = _URL_TYPE_ID_RE.search(url)
     if match:
-        try:
-            return int(match.group(1))
-        except ValueError:
-            return None
-    return None
+        return match.group(1), int(match.group(2))
+    return None, None
+
+@lru_cache(maxsize=None)
+def unknown_reference(url_type, ref_id):
+    """Placeholder reference for an ID with no loaded item, built once per (type, ID) and shared"""
+    return {'id': ref_id, 'name': f"Unknown {url_type} {ref_id}"}
 
-def find_item_by_id(item_id, data_list):
-    """Find item in data list by ID (1-based index)"""
-    if 1 <= item_id <= len(data_list):
-        return data_list[item_id - 1]  # Convert to 0-based index
-    return None
+def build_name_lookup(all_data):
+    """Map each data key to a list of its item names indexed by ID (IDs are dense 1-based positions; gaps are None)"""
+    name_lookup = {}
+    for data_key, items in all_data.items():
+        url_type = 'people' if data_key == 'characters' else data_key
+        name_lookup[data_key] = [None] + [
+            item.get('name', item.get('title', f"Unknown {url_type}")) if item else None
+            for item in items
+        ]
+    return name_lookup
 
-def resolve_references(data, all_data):
-    """Replace URL references with {id, name} objects"""
-    if isinstance(data, dict):
-        resolved = {}
-        for key, value in data.items():
+def build_reference_table(all_data, name_lookup):
+    """Map every loaded item's own URL to its resolved {id, name} reference, so known URLs need one dict lookup"""
+    url_refs = {}
+    for items in all_data.values():
+        for item in items:
+            url = item.get('url') if item else None
+            if not url:
+                continue
+            url_type, ref_id = parse_swapi_url(url)
+            data_key = 'characters' if url_type == 'people' else url_type
+            names = name_lookup.get(data_key)
+            name = names[ref_id] if names and ref_id is not None and ref_id < len(names) else None
+            if name is not None:
+                url_refs[url] = {'id': ref_id, 'name': name}
+    return url_refs
+
+def resolve_references(data, name_lookup, url_refs):
+    """Replace URL references with {id, name} objects, in place, walking nested data without recursion"""
+    # Per-field successes are only counted; one summary line is logged at the end
+    resolved_urls = total_urls = 0
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            # Pushed in reverse so items are processed in their original order
+            stack.extend(item for item in reversed(node) if isinstance(item, (dict, list)))
+            continue
+        if not isinstance(node, dict):
+            continue
+        
+        children = []
+        for key, value in node.items():
+            if key not in _REFERENCE_FIELDS:
+                # Plain fields (name, url, ...) are never references; only nested data is walked
+                if isinstance(value, (dict, list)):
+                    children.append(value)
+                continue
+            
             if isinstance(value, list) and value and isinstance(value[0], str) and value[0].startswith('https://swapi'):
                 # This is a list of URLs - resolve them
                 resolved_refs = []
                 successful_resolutions = 0
                 
                 for url in value:
-                    ref_id = extract_id_from_url(url)
-                    url_type = url.split('/')[-2]  # Extract type from URL (people, planets, etc.)
+                    ref = url_refs.get(url)
+                    if ref is not None:
+                        resolved_refs.append(ref)
+                        successful_resolutions += 1
+                        continue
+                    
+                    # Not a known item URL: parse it and fall back to the name lookup
+                    url_type, ref_id = parse_swapi_url(url)  # Type is people, planets, etc.
                     # Map people URLs to characters data
                     data_key = 'characters' if url_type == 'people' else url_type
                     
-                    if data_key in all_data and ref_id:
-                        # Find the referenced item by ID
-                        ref_item = find_item_by_id(ref_id, all_data[data_key])
-                        if ref_item:
-                            resolved_refs.append({
-                                'id': ref_id,
-                                'name': ref_item.get('name', ref_item.get('title', f"Unknown {url_type}"))
-                            })
+                    if data_key in name_lookup and ref_id:
+                        # Look up the referenced item's name by ID
+                        names = name_lookup[data_key]
+                        name = names[ref_id] if ref_id < len(names) else None
+                        if name is not None:
+                            resolved_refs.append({'id': ref_id, 'name': name})
                             successful_resolutions += 1
                         else:
-                            resolved_refs.append({'id': ref_id, 'name': f"Unknown {url_type} {ref_id}"})
+                            resolved_refs.append(unknown_reference(url_type, ref_id))
                 
                 # Only replace if we had some successful resolutions
+                total_urls += len(value)
                 if successful_resolutions > 0:
-                    resolved[key] = resolved_refs
-                    logging.info(f"Resolved {successful_resolutions}/{len(value)} URLs in {key}")
+                    node[key] = resolved_refs
+                    resolved_urls += successful_resolutions
                 else:
                     # Keep original URLs if no resolutions were successful
-                    resolved[key] = value
                     logging.warning(f"Kept original URLs in {key} (no successful resolutions)")
                     
-            elif isinstance(value, str) and value.startswith('https://swapi') and key != 'url':
-                # Single URL reference (skip 'url' field)
-                ref_id = extract_id_from_url(value)
-                url_type = value.split('/')[-2]
+            elif isinstance(value, str) and value.startswith('https://swapi'):
+                # Single URL reference
+                total_urls += 1
+                ref = url_refs.get(value)
+                if ref is not None:
+                    node[key] = ref
+                    resolved_urls += 1
+                    continue
+                url_type, ref_id = parse_swapi_url(value)
                 # Map people URLs to characters data
                 data_key = 'characters' if url_type == 'people' else url_type
                 
-                if data_key in all_data and ref_id:
-                    ref_item = find_item_by_id(ref_id, all_data[data_key])
-                    if ref_item:
-                        resolved[key] = {
-                            'id': ref_id,
-                            'name': ref_item.get('name', ref_item.get('title', f"Unknown {url_type}"))
-                        }
-                        logging.info(f"Resolved single URL in {key}")
+                if data_key in name_lookup and ref_id:
+                    names = name_lookup[data_key]
+                    name = names[ref_id] if ref_id < len(names) else None
+                    if name is not None:
+                        node[key] = {'id': ref_id, 'name': name}
+                        resolved_urls += 1
                     else:
                         # Keep original URL if resolution failed
-                        resolved[key] = value
                         logging.warning(f"Kept original URL in {key} (no match found)")
-                else:
-                    resolved[key] = value
-            else:
-                resolved[key] = resolve_references(value, all_data)
-        return resolved
-    elif isinstance(data, list):
-        return [resolve_references(item, all_data) for item in data]
-    else:
-        return data
+            elif isinstance(value, (dict, list)):
+                children.append(value)
+        stack.extend(reversed(children))
+    logging.info(f"Resolved {resolved_urls}/{total_urls} URL references")
+    return data
 
 def main():
     data_dir = "data/star-wars"
@@ -95,12 +151,18 @@ def main():
     # Load all existing JSON files
     logging.info("Loading existing JSON files...")
     all_data = {}
+    # Parse the files concurrently; results are consumed in category order
+    filepaths = {category: os.path.join(data_dir, "json", f"{category}.json") for category in categories}
+    with ThreadPoolExecutor(max_workers=len(categories)) as executor:
+        pending = {
+            category: executor.submit(load_json_file, filepath)
+            for category, filepath in filepaths.items() if os.path.exists(filepath)
+        }
     for category in categories:
-        filepath = os.path.join(data_dir, "json", f"{category}.json")
-        if os.path.exists(filepath):
+        filepath = filepaths[category]
+        if category in pending:
             try:
-                with open(filepath, 'r') as f:
-                    all_data[category] = json.load(f)
+                all_data[category] = pending[category].result()
                 logging.info(f"Loaded {len(all_data[category])} {category}")
             except (FileNotFoundError, PermissionError, json.JSONDecodeError) as e:
                 logging.error(f"Error loading {filepath}: {e}")
@@ -109,12 +171,17 @@ def main():
             logging.warning(f"{filepath} not found")
             all_data[category] = []
     
-    # Process each file and resolve references
+    # Process each file and resolve references; names are looked up before any data is rewritten
     logging.info("Resolving references...")
+    name_lookup = build_name_lookup(all_data)
+    url_refs = build_reference_table(all_data, name_lookup)
     for category in categories:
-        if all_data[category]:
+        # The lookups hold everything needed from other categories, so each category is
+        # released once it is saved (resolution is in place, so it is never held twice)
+        category_data = all_data.pop(category)
+        if category_data:
             logging.info(f"Processing {category}...")
-            resolved_data = resolve_references(all_data[category], all_data)
+            resolved_data = resolve_references(category_data, name_lookup, url_refs)
             
             # Save resolved data to enriched file
             # Ensure enriched subdirectory exists
@@ -122,11 +189,12 @@ def main():
             os.makedirs(enriched_dir, exist_ok=True)
             filepath = os.path.join(enriched_dir, f"{category}_enriched.json")
             try:
-                with open(filepath, 'w') as f:
-                    json.dump(resolved_data, f, indent=2)
+                save_json_file(resolved_data, filepath)
                 logging.info(f"Saved resolved {category} to {filepath}")
             except (FileNotFoundError, PermissionError, OSError) as e:
                 logging.error(f"Error saving {filepath}: {e}")
+            del resolved_data
+        del category_data
     
     logging.info("Reference resolution completed!")
 
@@ -1,17 +1,24 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
 import os
-import re
+from concurrent.futures import ThreadPoolExecutor
+
+from _jsonio import save_json_file
+
+# One pooled session for all category fetches, so connections (and TLS sessions) are kept alive;
+# the pool is sized for one connection per concurrently fetched category
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=6, pool_maxsize=6))
 
 def extract_id_from_url(url):
-    """Extract ID from SWAPI URL"""
-    match = re.search(r'/(\d+)/?$', url)
-    return int(match.group(1)) if match else None
+    """Extract ID from SWAPI URL (the last path segment, ignoring one trailing slash)"""
+    _, sep, tail = (url[:-1] if url.endswith('/') else url).rpartition('/')
+    return int(tail) if sep and tail.isdecimal() else None
 
 def fetch_all_data(endpoint):
     url = f"https://swapi.info/api/{endpoint}/"
     try:
-        response = requests.get(url, timeout=30)
+        response = _SESSION.get(url, timeout=30)
         response.raise_for_status()
         data = response.json()
         
@@ -27,25 +34,26 @@ def fetch_all_data(endpoint):
         print(f"Error fetching {endpoint}: {e}")
         raise
 
+def fetch_category(category):
+    """Fetch one category's records; runs on a worker thread"""
+    print(f"Fetching {category}...")
+    # Map characters to people for API endpoint
+    api_endpoint = 'people' if category == 'characters' else category
+    return fetch_all_data(api_endpoint)
+
 categories = ['films', 'characters', 'planets', 'species', 'vehicles', 'starships']
 output_dir = "data/star-wars"
 
-# Ensure output directory exists
-os.makedirs(output_dir, exist_ok=True)
+# Ensure output directory and json subdirectory exist
+json_dir = os.path.join(output_dir, "json")
+os.makedirs(json_dir, exist_ok=True)
 
-for category in categories:
-    print(f"Fetching {category}...")
-    # Map characters to people for API endpoint
-    api_endpoint = 'people' if category == 'characters' else category
-    data = fetch_all_data(api_endpoint)
-    
-    # Ensure json subdirectory exists
-    json_dir = os.path.join(output_dir, "json")
-    os.makedirs(json_dir, exist_ok=True)
-    filepath = os.path.join(json_dir, f"{category}.json")
-    try:
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
-        print(f"Saved {len(data)} {category} to {filepath}")
-    except (IOError, PermissionError, OSError) as e:
-        print(f"Error saving {filepath}: {e}")
\ No newline at end of file
+# Fetch all categories concurrently; results arrive in category order and are saved as they do
+with ThreadPoolExecutor(max_workers=len(categories)) as executor:
+    for category, data in zip(categories, executor.map(fetch_category, categories)):
+        filepath = os.path.join(json_dir, f"{category}.json")
+        try:
+            save_json_file(data, filepath)
+            print(f"Saved {len(data)} {category} to {filepath}")
+        except (IOError, PermissionError, OSError) as e:
+            print(f"Error saving {filepath}: {e}")
\ No newline at end of file